@@ -24,10 +24,16 @@ import subprocess
 import sys
 import argparse
 import signal
+import time
 from typing import List, Optional
 
 import httpx
 
+try:
+    import orjson as _json
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    import json as _json  # type: ignore[no-redef]
+
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
 
@@ -40,55 +46,158 @@ class ProcessManager:
     def __init__(self):
         self.processes: List[subprocess.Popen] = []
     
-    def start_process(self, cmd: List[str], name: str, env: Optional[dict] = None, capture_output: bool = True) -> subprocess.Popen:
-        """Start a subprocess and track it."""
-        logger.info(f"Starting {name}...")
-        process_env = env if env is not None else os.environ.copy()
+    def start_process(
+        self,
+        cmd: List[str],
+        name: str,
+        env: Optional[dict] = None,
+        capture_output: bool = True,
+        log_file: Optional[str] = None
+    ) -> subprocess.Popen:
+        """Start a subprocess and track it.
         
-        if capture_output:
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env=process_env
-            )
+        Args:
+            cmd: Command line to run
+            name: Human-readable process name for logging
+            env: Environment for the child (defaults to a copy of os.environ)
+            capture_output: If True, keep the child's output off the console;
+                if False, let it write to this terminal
+            log_file: If given, append the child's stdout and stderr to this
+                file instead (takes precedence over capture_output)
+        """
+        logger.info("Starting %s...", name)
+        log = open(log_file, "ab") if log_file is not None else None
+        if log is not None:
+            stdout, stderr = log, subprocess.STDOUT
         else:
+            # Nothing reads the child's output, so a pipe would eventually fill
+            # up and block it; discard the output instead
+            stdout = stderr = subprocess.DEVNULL if capture_output else None
+        try:
+            # Children get their own session so a terminal Ctrl+C reaches only
+            # this script, which then shuts them all down in stop_all()
             proc = subprocess.Popen(
                 cmd,
-                env=process_env
+                stdout=stdout,
+                stderr=stderr,
+                env=env if env is not None else os.environ.copy(),
+                start_new_session=True
             )
+        finally:
+            # The child holds its own copy of the descriptor
+            if log is not None:
+                log.close()
         self.processes.append(proc)
         return proc
     
-    def stop_all(self):
-        """Stop all managed processes."""
+    def stop_all(self, timeout: float = 3.0):
+        """Stop all managed processes.
+        
+        Sends SIGTERM to every process first, then waits for all of them
+        against one shared deadline, and kills whatever is still running.
+        
+        Args:
+            timeout: Total time to wait for graceful shutdown
+        """
         logger.info("Stopping all processes...")
         for proc in self.processes:
-            try:
+            if proc.poll() is None:
                 proc.terminate()
-                proc.wait(timeout=3)
+        
+        deadline = time.monotonic() + timeout
+        for proc in self.processes:
+            try:
+                proc.wait(timeout=max(0.0, deadline - time.monotonic()))
             except subprocess.TimeoutExpired:
                 proc.kill()
+                proc.wait()
                 logger.warning("Force killed a process")
         self.processes.clear()
 
 
-async def wait_for_health(url: str, timeout: float = 10.0, name: str = "service") -> bool:
+async def wait_for_health(
+    url: str,
+    client: httpx.AsyncClient,
+    timeout: float = 10.0,
+    name: str = "service"
+) -> bool:
     """Wait for a service to be healthy."""
-    logger.info(f"Waiting for {name} to be ready...")
+    logger.info("Waiting for %s to be ready...", name)
     
-    start = asyncio.get_event_loop().time()
-    async with httpx.AsyncClient() as client:
-        while (asyncio.get_event_loop().time() - start) < timeout:
-            try:
-                resp = await client.get(url, timeout=0.5)
-                if resp.status_code == 200:
-                    logger.info(f"  ✓ {name} is ready")
+    now = asyncio.get_running_loop().time
+    deadline = now() + timeout
+    delay = 0.025
+    while now() < deadline:
+        try:
+            resp = await client.get(url, timeout=0.5)
+            if resp.status_code == 200:
+                logger.info("  ✓ %s is ready", name)
+                return True
+        except (httpx.ConnectError, httpx.TimeoutException):
+            # Not listening yet
+            pass
+        
+        # Exponential backoff: 25ms, 50ms, ... capped at 400ms
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.4)
+    
+    logger.error("  ✗ %s failed to start (timeout)", name)
+    return False
+
+
+async def poll_for_registration(
+    client: httpx.AsyncClient,
+    league_url: str,
+    num_agents: int
+) -> bool:
+    """Poll /agents until the expected number of players has registered."""
+    for _ in range(30):  # 15 seconds timeout
+        try:
+            resp = await client.get(f"{league_url}/agents", timeout=1.0)
+            if resp.status_code == 200:
+                data = _json.loads(resp.content)
+                registered = len(data.get("agents", []))
+                if registered >= num_agents:
                     return True
-            except Exception:
-                await asyncio.sleep(0.25)
+                logger.debug("  %s/%s agents registered...", registered, num_agents)
+        except Exception as e:
+            logger.debug("Waiting for registration: %s", e)
+        await asyncio.sleep(0.5)
+    
+    return False
+
+
+async def poll_for_completion(
+    client: httpx.AsyncClient,
+    league_url: str,
+    expected_games: int,
+    rounds: int
+) -> bool:
+    """Poll /standings until the expected number of games has been played."""
+    last_games = 0
+    for _ in range(300):  # 5 minutes max
+        try:
+            resp = await client.get(f"{league_url}/standings", timeout=1.0)
+            if resp.status_code == 200:
+                data = _json.loads(resp.content)
+                total_games = data.get("total_games", 0)
+                rounds_completed = data.get("rounds_completed", 0)
+                
+                if total_games != last_games:
+                    logger.info(
+                        "  Progress: %s/%s games, %s/%s rounds",
+                        total_games, expected_games, rounds_completed, rounds,
+                    )
+                    last_games = total_games
+                
+                if total_games >= expected_games:
+                    logger.info("  ✓ Tournament complete!")
+                    return True
+        except Exception:
+            pass
+        
+        await asyncio.sleep(1.0)
     
-    logger.error(f"  ✗ {name} failed to start (timeout)")
     return False
 
 
@@ -114,6 +223,12 @@ async def run_full_league(
         Exit code (0 for success)
     """
     proc_manager = ProcessManager()
+    # One pooled client for every phase, so health checks, registration
+    # and standings requests reuse keep-alive connections
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=32),
+        timeout=httpx.Timeout(5.0)
+    )
     
     try:
         # Setup paths
@@ -132,11 +247,14 @@ async def run_full_league(
         logger.info("  PARITY GAME LEAGUE - COMPLETE SYSTEM WITH EXTERNAL REFEREE")
         logger.info("=" * 70)
         logger.info("")
-        logger.info(f"Configuration:")
-        logger.info(f"  League Manager: http://127.0.0.1:{port}")
-        logger.info(f"  Referee:        http://127.0.0.1:{referee_port}")
-        logger.info(f"  Players:        {num_agents} agents on ports {base_agent_port}-{base_agent_port + num_agents - 1}")
-        logger.info(f"  Rounds:         {rounds}")
+        logger.info("Configuration:")
+        logger.info("  League Manager: http://127.0.0.1:%s", port)
+        logger.info("  Referee:        http://127.0.0.1:%s", referee_port)
+        logger.info(
+            "  Players:        %s agents on ports %s-%s",
+            num_agents, base_agent_port, base_agent_port + num_agents - 1,
+        )
+        logger.info("  Rounds:         %s", rounds)
         logger.info("")
         
         # Step 1: Start League Manager
@@ -154,7 +272,7 @@ async def run_full_league(
             env
         )
         
-        if not await wait_for_health(f"{league_url}/health", name="League Manager"):
+        if not await wait_for_health(f"{league_url}/health", client, name="League Manager"):
             return 1
         
         # Step 2: Start External Referee
@@ -172,7 +290,7 @@ async def run_full_league(
             capture_output=False  # Show referee output with game decisions
         )
         
-        if not await wait_for_health(f"http://127.0.0.1:{referee_port}/health", name="Referee"):
+        if not await wait_for_health(f"http://127.0.0.1:{referee_port}/health", client, name="Referee"):
             return 1
         
         # Give referee time to register
@@ -180,152 +298,173 @@ async def run_full_league(
         
         # Step 3: Start Player Agents
         logger.info("")
-        logger.info(f"Step 3: Starting {num_agents} Player Agents...")
+        logger.info("Step 3: Starting %s Player Agents...", num_agents)
         
         agent_names = ["Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", "Eta", "Theta"]
         strategies = ["random", "always_even", "always_odd", "alternating", "adaptive", "counter", "biased_random_70", "deterministic"]
         
+        # Resolve every player's name and strategy once
+        resolved_names = [
+            agent_names[i] if i < len(agent_names) else f"Agent{i+1}"
+            for i in range(num_agents)
+        ]
+        resolved_strategies = [strategies[i % len(strategies)] for i in range(num_agents)]
+        
         logger.info("")
         logger.info("Agent Strategies:")
-        for i in range(num_agents):
-            agent_name = agent_names[i] if i < len(agent_names) else f"Agent{i+1}"
-            strategy = strategies[i % len(strategies)]
-            logger.info(f"  • {agent_name}: {strategy}")
+        for agent_name, strategy in zip(resolved_names, resolved_strategies):
+            logger.info("  • %s: %s", agent_name, strategy)
         logger.info("")
         
+        # Parts of the player command line shared by every player
+        player_cmd_prefix = [python_exe, "-m", "agents.player"]
+        player_cmd_suffix = ["--league-url", league_url, "--log-level", "WARNING"]
+        
+        players = []
         for i in range(num_agents):
             agent_port = base_agent_port + i
-            agent_name = agent_names[i] if i < len(agent_names) else f"Agent{i+1}"
-            strategy = strategies[i % len(strategies)]
+            agent_name = resolved_names[i]
+            strategy = resolved_strategies[i]
             
             proc_manager.start_process(
-                [
-                    python_exe, "-m", "agents.player",
-                    "--port", str(agent_port),
-                    "--display-name", agent_name,
-                    "--league-url", league_url,
-                    "--strategy", strategy,
-                    "--log-level", "WARNING"
-                ],
+                player_cmd_prefix
+                + ["--port", str(agent_port), "--display-name", agent_name, "--strategy", strategy]
+                + player_cmd_suffix,
                 f"Player {agent_name}",
                 env
             )
-            
-            # Wait for player to be healthy
-            if not await wait_for_health(f"http://127.0.0.1:{agent_port}/health", timeout=5, name=f"Player {agent_name}"):
-                logger.error(f"Failed to start player {agent_name}")
+            players.append((agent_port, agent_name))
+        
+        # Wait for all players to be healthy concurrently. Players boot in
+        # parallel and compete for CPU, so allow more time than for one.
+        healthy = await asyncio.gather(*(
+            wait_for_health(
+                f"http://127.0.0.1:{agent_port}/health",
+                client,
+                timeout=10,
+                name=f"Player {agent_name}"
+            )
+            for agent_port, agent_name in players
+        ), return_exceptions=True)
+        for (_, agent_name), ok in zip(players, healthy):
+            if ok is not True:
+                if isinstance(ok, BaseException):
+                    logger.error("Failed to start player %s: %s", agent_name, ok)
+                else:
+                    logger.error("Failed to start player %s", agent_name)
                 return 1
         
         # Step 4: Wait for all agents to register
         logger.info("")
         logger.info("Step 4: Waiting for all agents to register...")
         
-        async with httpx.AsyncClient() as client:
-            for _ in range(30):  # 15 seconds timeout
-                try:
-                    resp = await client.get(f"{league_url}/agents", timeout=1.0)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        registered = len(data.get("agents", []))
-                        if registered >= num_agents:
-                            logger.info(f"  ✓ All {num_agents} players registered")
-                            break
-                        else:
-                            logger.debug(f"  {registered}/{num_agents} agents registered...")
-                except Exception as e:
-                    logger.debug(f"Waiting for registration: {e}")
-                await asyncio.sleep(0.5)
+        try:
+            resp = await client.get(
+                f"{league_url}/wait-for-agents",
+                params={"count": num_agents, "timeout": 15.0},
+                timeout=20.0
+            )
+            if resp.status_code == 404:
+                # Older League Manager without /wait-for-agents
+                registered = await poll_for_registration(client, league_url, num_agents)
             else:
-                logger.warning(f"Not all agents registered in time, proceeding anyway")
-            
-            # Step 5: Start the tournament
-            logger.info("")
-            logger.info("=" * 70)
-            logger.info("Step 5: Starting Tournament!")
-            logger.info("=" * 70)
-            logger.info("")
-            
-            try:
-                resp = await client.post(f"{league_url}/start", timeout=5.0)
-                if resp.status_code == 200:
-                    result = resp.json()
-                    logger.info(f"✓ Tournament started: {result.get('message')}")
-                else:
-                    logger.error(f"Failed to start tournament: {resp.text}")
-                    return 1
-            except Exception as e:
-                logger.error(f"Error starting tournament: {e}")
+                registered = (
+                    resp.status_code == 200 and _json.loads(resp.content).get("ready", False)
+                )
+        except httpx.HTTPError as e:
+            logger.debug("Waiting for registration: %s", e)
+            registered = False
+        
+        if registered:
+            logger.info("  ✓ All %s players registered", num_agents)
+        else:
+            logger.warning("Not all agents registered in time, proceeding anyway")
+        
+        # Step 5: Start the tournament
+        logger.info("")
+        logger.info("=" * 70)
+        logger.info("Step 5: Starting Tournament!")
+        logger.info("=" * 70)
+        logger.info("")
+        
+        try:
+            resp = await client.post(f"{league_url}/start", timeout=5.0)
+            if resp.status_code == 200:
+                result = _json.loads(resp.content)
+                logger.info("✓ Tournament started: %s", result.get('message'))
+            else:
+                logger.error("Failed to start tournament: %s", resp.text)
                 return 1
-            
-            # Step 6: Wait for tournament to complete
-            logger.info("")
-            logger.info("Tournament in progress...")
-            logger.info("(Watch the League Manager output for match details)")
-            logger.info("")
-            
-            # Poll for completion (check if total_games increases)
-            expected_games = (num_agents * (num_agents - 1) // 2) * rounds
-            logger.info(f"Expected total games: {expected_games}")
-            
-            last_games = 0
-            for _ in range(300):  # 5 minutes max
-                try:
-                    resp = await client.get(f"{league_url}/standings", timeout=1.0)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        total_games = data.get("total_games", 0)
-                        rounds_completed = data.get("rounds_completed", 0)
-                        
-                        if total_games != last_games:
-                            logger.info(f"  Progress: {total_games}/{expected_games} games, {rounds_completed}/{rounds} rounds")
-                            last_games = total_games
-                        
-                        if total_games >= expected_games:
-                            logger.info(f"  ✓ Tournament complete!")
-                            break
-                except Exception:
-                    pass
+        except Exception as e:
+            logger.error("Error starting tournament: %s", e)
+            return 1
+        
+        # Step 6: Wait for tournament to complete
+        logger.info("")
+        logger.info("Tournament in progress...")
+        logger.info("(Watch the League Manager output for match details)")
+        logger.info("")
+        
+        # Block on the League Manager until all games are played
+        expected_games = (num_agents * (num_agents - 1) // 2) * rounds
+        logger.info("Expected total games: %s", expected_games)
+        
+        try:
+            resp = await client.get(
+                f"{league_url}/wait-complete",
+                params={"expected": expected_games, "timeout": 300.0},
+                timeout=310.0
+            )
+            if resp.status_code == 404:
+                # Older League Manager without /wait-complete
+                await poll_for_completion(client, league_url, expected_games, rounds)
+            elif resp.status_code == 200 and _json.loads(resp.content).get("complete"):
+                logger.info("  ✓ Tournament complete!")
+            else:
+                logger.warning("Tournament did not complete in time")
+        except httpx.HTTPError as e:
+            logger.error("Error waiting for tournament: %s", e)
+        
+        # Step 7: Display final standings
+        logger.info("")
+        logger.info("=" * 70)
+        logger.info("FINAL STANDINGS")
+        logger.info("=" * 70)
+        
+        try:
+            resp = await client.get(f"{league_url}/standings", timeout=5.0)
+            if resp.status_code == 200:
+                data = _json.loads(resp.content)
+                standings = data.get("standings", [])
                 
-                await asyncio.sleep(1.0)
-            
-            # Step 7: Display final standings
-            logger.info("")
-            logger.info("=" * 70)
-            logger.info("FINAL STANDINGS")
-            logger.info("=" * 70)
-            
-            try:
-                resp = await client.get(f"{league_url}/standings", timeout=5.0)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    standings = data.get("standings", [])
-                    
-                    logger.info("")
-                    logger.info(f"{'Rank':<6} {'Agent':<15} {'Points':<8} {'W-L-D':<12} {'Win Rate':<10}")
-                    logger.info("-" * 70)
-                    
-                    for standing in standings:
-                        rank = standing["rank"]
-                        agent = standing["agent"]
-                        points = standing["points"]
-                        wins = standing["wins"]
-                        losses = standing["losses"]
-                        draws = standing["draws"]
-                        win_rate = standing["win_rate"]
-                        
-                        wld = f"{wins}-{losses}-{draws}"
-                        logger.info(f"{rank:<6} {agent:<15} {points:<8} {wld:<12} {win_rate:<10}")
-                    
-                    logger.info("=" * 70)
-                    
-                    if standings:
-                        champion = standings[0]["agent"]
-                        logger.info(f"\n🏆 CHAMPION: {champion} 🏆\n")
+                logger.info("")
+                logger.info("%-6s %-15s %-8s %-12s %-10s", "Rank", "Agent", "Points", "W-L-D", "Win Rate")
+                logger.info("-" * 70)
+                
+                for standing in standings:
+                    rank = standing["rank"]
+                    agent = standing["agent"]
+                    points = standing["points"]
+                    wins = standing["wins"]
+                    losses = standing["losses"]
+                    draws = standing["draws"]
+                    win_rate = standing["win_rate"]
                     
-                    logger.info(f"Total games played: {data.get('total_games')}")
-                    logger.info(f"Rounds completed: {data.get('rounds_completed')}")
-            except Exception as e:
-                logger.error(f"Error fetching final standings: {e}")
+                    wld = f"{wins}-{losses}-{draws}"
+                    logger.info(
+                        "%-6s %-15s %-8s %-12s %-10s", rank, agent, points, wld, win_rate
+                    )
+                
+                logger.info("=" * 70)
+                
+                if standings:
+                    champion = standings[0]["agent"]
+                    logger.info("\n🏆 CHAMPION: %s 🏆\n", champion)
+                
+                logger.info("Total games played: %s", data.get('total_games'))
+                logger.info("Rounds completed: %s", data.get('rounds_completed'))
+        except Exception as e:
+            logger.error("Error fetching final standings: %s", e)
         
         logger.info("")
         logger.info("Tournament complete!")
@@ -336,11 +475,12 @@ async def run_full_league(
         return 130
         
     except Exception as e:
-        logger.error(f"Error running league: {e}", exc_info=True)
+        logger.error("Error running league: %s", e, exc_info=True)
         return 1
         
     finally:
         # Cleanup
+        await client.aclose()
         proc_manager.stop_all()
         logger.info("✓ All processes stopped")
 
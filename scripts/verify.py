@@ -4,10 +4,82 @@ Quick verification that the league system works.
 
 This script runs a minimal league (2 agents, 1 round) to verify everything is working.
 """
+import os
+import re
+import signal
 import subprocess
 import sys
+import threading
 import time
-import requests
+from collections import deque
+
+# Output lines kept for the failure report
+TAIL_LINES = 200
+
+# Overall time limit for the league run
+RUN_TIMEOUT = 30
+
+# Output markers of a healthy run, matched in a single pass per line
+SUCCESS_INDICATORS = (
+    "League Manager ready",
+    "agents started successfully",
+    "agents registered",
+    "STARTING LEAGUE COMPETITION",
+    "LEAGUE COMPETITION COMPLETE",
+)
+_INDICATOR_PATTERN = re.compile("|".join(map(re.escape, SUCCESS_INDICATORS)))
+
+# Ports used by league components (same set as scripts/cleanup.sh)
+LEAGUE_PORT_SPECS = ("-iTCP:9000", "-iTCP:8001-8110")
+
+
+def _league_port_pids() -> set[int]:
+    """Find processes holding the league ports, with a single lsof call."""
+    try:
+        result = subprocess.run(
+            ["lsof", "-t", *LEAGUE_PORT_SPECS],
+            capture_output=True,
+            text=True,
+            check=False
+        )
+    except FileNotFoundError:
+        return set()
+    return {int(pid) for pid in result.stdout.split()} - {os.getpid()}
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def cleanup_processes(grace: float = 1.0):
+    """Stop league components left on the league ports.
+    
+    In-process equivalent of scripts/cleanup.sh: SIGTERM everything found,
+    wait up to `grace` seconds for it to exit, then SIGKILL the rest.
+    """
+    pids = _league_port_pids()
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    
+    deadline = time.monotonic() + grace
+    while pids and time.monotonic() < deadline:
+        time.sleep(0.05)
+        pids = {pid for pid in pids if _is_alive(pid)}
+    
+    for pid in pids:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
 
 def main():
     print("=" * 60)
@@ -17,7 +89,7 @@ def main():
     
     # Step 1: Cleanup
     print("Step 1: Cleaning up any existing processes...")
-    subprocess.run(["bash", "scripts/cleanup.sh"], check=False, capture_output=True)
+    cleanup_processes()
     print("✓ Cleanup complete")
     print()
     
@@ -27,27 +99,59 @@ def main():
     print()
     
     try:
-        result = subprocess.run(
-            ["python3", "scripts/run_league.py", "--num-agents", "2", "--rounds", "1"],
-            timeout=30,
-            capture_output=True,
-            text=True
+        proc = subprocess.Popen(
+            [sys.executable, "scripts/run_league.py", "--num-agents", "2", "--rounds", "1"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            # Nothing of ours leaks into the child anyway, and without the
+            # fd sweep subprocess can launch via posix_spawn
+            close_fds=False
         )
         
-        output = result.stdout + result.stderr
+        # Kill the run if it exceeds the time limit; reading stdout then
+        # hits EOF and the loop below ends
+        timed_out = threading.Event()
+        
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+        
+        watchdog = threading.Timer(RUN_TIMEOUT, kill_on_timeout)
+        watchdog.start()
+        
+        # Check for success indicators as output streams in, keeping only
+        # the tail of the output for the failure report
+        remaining = set(SUCCESS_INDICATORS)
+        tail = deque(maxlen=TAIL_LINES)
+        
+        try:
+            for line in proc.stdout:
+                tail.append(line.rstrip("\n"))
+                for match in _INDICATOR_PATTERN.finditer(line):
+                    remaining.discard(match.group())
+                if not remaining:
+                    break
+            
+            # Every indicator has been seen, so the rest of the run adds
+            # nothing; interrupt it like Ctrl+C so it still stops its agents
+            if not remaining and proc.poll() is None:
+                proc.send_signal(signal.SIGINT)
+                try:
+                    # Keep draining output so shutdown logging cannot block
+                    proc.communicate(timeout=5)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+            proc.wait()
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
         
-        # Check for success indicators
-        success_indicators = [
-            "League Manager ready",
-            "agents started successfully",
-            "agents registered",
-            "STARTING LEAGUE COMPETITION"
-        ]
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(proc.args, RUN_TIMEOUT)
         
-        failures = []
-        for indicator in success_indicators:
-            if indicator not in output:
-                failures.append(indicator)
+        failures = [indicator for indicator in SUCCESS_INDICATORS if indicator in remaining]
         
         if failures:
             print("✗ VERIFICATION FAILED")
@@ -57,7 +161,7 @@ def main():
                 print(f"  - {f}")
             print()
             print("Output:")
-            print(output[-1000:])  # Last 1000 chars
+            print("\n".join(tail))
             return 1
         else:
             print("✓ VERIFICATION PASSED!")
@@ -74,7 +178,7 @@ def main():
             
     except subprocess.TimeoutExpired:
         print("✗ VERIFICATION TIMEOUT")
-        print("The league took too long to run (>30s)")
+        print(f"The league took too long to run (>{RUN_TIMEOUT}s)")
         return 1
     except Exception as e:
         print(f"✗ VERIFICATION ERROR: {e}")
@@ -83,7 +187,7 @@ def main():
         # Always cleanup
         print()
         print("Cleaning up...")
-        subprocess.run(["bash", "scripts/cleanup.sh"], check=False, capture_output=True)
+        cleanup_processes()
         print("✓ Done")
 
 if __name__ == "__main__":
@@ -2,19 +2,52 @@
 
 Contains the League Manager and Referee for running parity game competitions.
 """
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 __version__ = "1.0.0"
 
+# Background thread that writes queued records to the console
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging(level: str = "INFO") -> None:
     """Setup logging configuration.
     
+    Records are handed to a queue and written by a listener thread, so
+    logging from the event loop never blocks on console I/O. The listener
+    is flushed and stopped at interpreter exit.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
     """
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+    global _listener
+    
+    if _listener is not None:
+        _listener.stop()
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(
+        fmt='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
         datefmt='%H:%M:%S'
-    )
+    ))
+    
+    # Route every record through the queue instead of writing inline
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(getattr(logging, level.upper()))
+    root_logger.handlers.clear()
+    root_logger.addHandler(QueueHandler(log_queue))
+    
+    _listener = QueueListener(log_queue, console_handler)
+    _listener.start()
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Drain pending records before the interpreter exits."""
+    if _listener is not None:
+        _listener.stop()
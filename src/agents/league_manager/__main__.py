@@ -1,15 +1,21 @@
 """Main entrypoint for running the complete league.
 
 Usage:
-    python -m league                      # Run with 4 agents, 3 rounds
-    python -m league --num-agents 6       # Run with 6 agents
-    python -m league --rounds 5           # Run 5 rounds per matchup
-    python -m league --log-level DEBUG    # Verbose logging
+    python -m agents.league_manager                      # Run with 4 agents, 3 rounds
+    python -m agents.league_manager --num-agents 6       # Run with 6 agents
+    python -m agents.league_manager --rounds 5           # Run 5 rounds per matchup
+    python -m agents.league_manager --log-level DEBUG    # Verbose logging
+    python scripts/run_league.py ...                     # Same, without setting PYTHONPATH
+
+The League Manager runs in this process, on the same event loop that spawns
+and supervises the agents; readiness and registration waits use its events
+directly. To run the manager (and referee) as separate processes, use
+scripts/run_full_league.py, which drives them over the HTTP API.
 """
 import asyncio
 import logging
 import os
-import subprocess
+import signal
 import sys
 from typing import List, Optional
 
@@ -21,78 +27,169 @@ from agents.league_manager.manager import LeagueManager
 
 logger = logging.getLogger(__name__)
 
+# Project root (up from agents/league_manager/__main__.py) and its src directory
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+_SRC_PATH = os.path.join(_PROJECT_ROOT, "src")
+
+# Environment for agent processes; shared by all spawns and never mutated
+_BASE_ENV = {**os.environ, "PYTHONPATH": _SRC_PATH}
+
+# Fixed parts of the player command line
+_PYTHON_EXE = sys.executable
+_PLAYER_CMD_TAIL = ("--log-level", "WARNING")
+
+# Base for the loopback URLs probed during startup
+_LOOPBACK_URL = httpx.URL("http://127.0.0.1")
+
+# Health probes only go to loopback, so a slow answer means "not up yet"
+_PROBE_TIMEOUT = httpx.Timeout(0.2, connect=0.1)
+
+# The orchestrator's shared client: enough keep-alive slots for one idle
+# connection per agent and the manager, held across the whole run
+_CLIENT_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=32, keepalive_expiry=30.0
+)
+_CLIENT_TIMEOUT = httpx.Timeout(1.0, connect=0.2)
+
+
+async def _discard(stream: asyncio.StreamReader):
+    """Read and drop a stream until EOF."""
+    while await stream.read(65536):
+        pass
 
-# Filter to suppress CancelledError during shutdown
-class SuppressCancelledErrorFilter(logging.Filter):
-    def filter(self, record):
-        if record.exc_info:
-            exc_type = record.exc_info[0]
-            if exc_type is asyncio.CancelledError:
-                return False
-        return True
+
+async def _read_available(
+    stream: Optional[asyncio.StreamReader],
+    max_bytes: int = 4096,
+    timeout: float = 0.2
+) -> str:
+    """Read what is already in a stream, waiting at most `timeout` for it."""
+    if stream is None:
+        return ""
+    try:
+        data = await asyncio.wait_for(stream.read(max_bytes), timeout)
+    except asyncio.TimeoutError:
+        return ""
+    return data.decode(errors="replace")
 
 
 class AgentProcess:
-    """Manages a single agent subprocess."""
+    """Manages a single agent subprocess.
+    
+    Each agent is its own `python -m agents.player` process rather than a
+    process-pool worker: agents are long-lived servers that must be
+    signalled, awaited and diagnosed individually, which pool workers do
+    not support.
+    """
     
-    def __init__(self, port: int, name: str, league_url: str, strategy: str = "random"):
+    def __init__(
+        self,
+        port: int,
+        name: str,
+        league_url: str,
+        strategy: str = "random",
+        capture_output: bool = False
+    ):
         self.port = port
         self.name = name
         self.league_url = league_url
         self.strategy = strategy
+        # Show the agent's stdout (instead of discarding it) when debugging
+        self.capture_output = capture_output
         self.endpoint = f"http://127.0.0.1:{port}/mcp"
-        self.health_url = f"http://127.0.0.1:{port}/health"
-        self.process: Optional[subprocess.Popen] = None
+        # Parsed once here rather than by httpx on every probe
+        self.health_url = _LOOPBACK_URL.copy_with(port=port, path="/health")
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._stderr_drain: Optional[asyncio.Task] = None
     
-    async def start(self, client: httpx.AsyncClient) -> bool:
-        """Start the agent process."""
+    def _build_argv(self) -> List[str]:
+        """Command line for this agent's player process."""
+        return [
+            _PYTHON_EXE, "-m", "agents.player",
+            "--port", str(self.port),
+            "--display-name", self.name,
+            "--league-url", self.league_url,
+            "--strategy", self.strategy,
+            *_PLAYER_CMD_TAIL,
+        ]
+    
+    async def spawn(self) -> bool:
+        """Launch the agent process without waiting for it to come up."""
         try:
-            # Find Python executable
-            python_exe = sys.executable
+            logger.info(f"Starting agent '{self.name}' on port {self.port} with strategy '{self.strategy}'")
             
-            # Calculate src directory (go up from agents/league_manager/__main__.py to project root, then add src)
-            current_file = os.path.abspath(__file__)
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(current_file))))
-            src_path = os.path.join(project_root, "src")
+            # Spawned through the event loop so it keeps serving other
+            # coroutines (e.g. health probes of agents already launched)
+            self.process = await asyncio.create_subprocess_exec(
+                *self._build_argv(),
+                stdout=None if self.capture_output else asyncio.subprocess.DEVNULL,
+                # Piped only to report why an agent failed to start
+                stderr=asyncio.subprocess.PIPE,
+                env=_BASE_ENV,
+                # Our descriptors are non-inheritable, so there is nothing to
+                # close in the child; this keeps the spawn on the posix_spawn path
+                close_fds=False
+            )
+            return True
             
-            logger.info(f"Starting agent '{self.name}' on port {self.port} with strategy '{self.strategy}'")
+        except Exception as e:
+            logger.error(f"  ✗ Error starting agent '{self.name}': {e}")
+            return False
+    
+    async def await_ready(
+        self,
+        client: httpx.AsyncClient,
+        manager: Optional[LeagueManager] = None,
+        poll_interval: float = 0.05,
+        timeout: float = 15.0,
+        registration_timeout: float = 2.0
+    ) -> bool:
+        """Wait for the spawned agent to answer its health check.
+        
+        Args:
+            client: HTTP client used for the probes
+            manager: In-process League Manager the agent registers with; if
+                given, probing waits briefly for the agent to register first
+            poll_interval: Seconds between probes (they are loopback-only)
+            timeout: Seconds to wait before giving up
+            registration_timeout: Most seconds spent waiting for registration;
+                a late or rejected registration only delays the probes
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
             
-            env = os.environ.copy()
-            env["PYTHONPATH"] = src_path
+            # Best effort: registration implies the server is up, but the
+            # health probe below stays the readiness check
+            if manager is not None:
+                await self._await_registration(manager, min(registration_timeout, timeout))
             
-            self.process = subprocess.Popen(
-                [
-                    python_exe, "-m", "agents.player",
-                    "--port", str(self.port),
-                    "--display-name", self.name,
-                    "--league-url", self.league_url,
-                    "--strategy", self.strategy,
-                    "--log-level", "WARNING",
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                env=env
-            )
+            # Built once and re-sent; a bodiless GET can be replayed as is
+            probe = client.build_request("GET", self.health_url, timeout=_PROBE_TIMEOUT)
             
-            # Wait for health check (async)
-            for _ in range(30):  # 15 seconds timeout
+            # Wait for health check (async); stop early if the process died
+            while loop.time() < deadline and self.process.returncode is None:
                 try:
-                    resp = await client.get(self.health_url, timeout=0.5)
+                    resp = await client.send(probe)
                     if resp.status_code == 200:
                         logger.info(f"  ✓ Agent '{self.name}' ready on port {self.port}")
+                        # stderr is no longer needed; keep discarding it so a
+                        # chatty agent never blocks on a full pipe
+                        self._stderr_drain = asyncio.create_task(
+                            _discard(self.process.stderr)
+                        )
                         return True
                 except Exception:
-                    await asyncio.sleep(0.5)
+                    pass
+                await asyncio.sleep(poll_interval)
             
-            # Agent failed - try to get error output
-            if self.process.poll() is not None:
-                # Process has terminated
-                stderr = self.process.stderr.read().decode() if self.process.stderr else ""
-                stdout = self.process.stdout.read().decode() if self.process.stdout else ""
-                if stderr:
-                    logger.error(f"  ✗ Agent stderr: {stderr[:200]}")
-                if stdout:
-                    logger.debug(f"  Agent stdout: {stdout[:200]}")
+            # Agent failed - try to get error output; the read is bounded,
+            # so a hung agent that is still alive cannot stall us here
+            stderr = await _read_available(self.process.stderr)
+            if stderr:
+                logger.error(f"  ✗ Agent stderr: {stderr[:200]}")
             
             logger.error(f"  ✗ Agent '{self.name}' failed to start")
             return False
@@ -101,16 +198,77 @@ class AgentProcess:
             logger.error(f"  ✗ Error starting agent '{self.name}': {e}")
             return False
     
-    def stop(self):
+    async def _await_registration(self, manager: LeagueManager, timeout: float):
+        """Wait for the agent's boot-time registration, or for it to exit."""
+        registered = asyncio.ensure_future(manager.wait_for_agent(self.name, timeout))
+        exited = asyncio.ensure_future(self.process.wait())
+        try:
+            await asyncio.wait(
+                (registered, exited), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            registered.cancel()
+            exited.cancel()
+    
+    async def start(self, client: httpx.AsyncClient) -> bool:
+        """Start the agent process and wait until it is healthy."""
+        return await self.spawn() and await self.await_ready(client)
+    
+    def signal_terminate(self):
+        """Ask the agent process to exit without waiting for it."""
+        if self.process and self.process.returncode is None:
+            self.process.terminate()
+    
+    async def await_exit(self, timeout: float = 3.0):
+        """Wait for the agent process to exit, killing it after `timeout`."""
+        if not self.process:
+            return
+        try:
+            await asyncio.wait_for(self.process.wait(), timeout=timeout)
+            logger.debug(f"Agent '{self.name}' stopped")
+        except asyncio.TimeoutError:
+            self.process.kill()
+            await self.process.wait()
+            logger.warning(f"Agent '{self.name}' force killed")
+    
+    async def stop(self):
         """Stop the agent process."""
-        if self.process:
-            try:
-                self.process.terminate()
-                self.process.wait(timeout=3)
-                logger.debug(f"Agent '{self.name}' stopped")
-            except subprocess.TimeoutExpired:
-                self.process.kill()
-                logger.warning(f"Agent '{self.name}' force killed")
+        self.signal_terminate()
+        await self.await_exit()
+
+
+async def _await_all_ready(
+    agents: List[AgentProcess],
+    client: httpx.AsyncClient,
+    manager: LeagueManager
+) -> List[str]:
+    """Wait for every agent to become healthy, failing fast.
+    
+    The readiness checks run concurrently. As soon as one fails, the others
+    are cancelled instead of being left to run out their timeouts; they are
+    also cancelled if the caller is.
+    
+    Returns:
+        Names of the agents that failed (empty if all are ready)
+    """
+    tasks = {
+        asyncio.ensure_future(agent.await_ready(client, manager)): agent
+        for agent in agents
+    }
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            failed = [
+                tasks[task].name for task in done
+                if task.cancelled() or task.exception() is not None or task.result() is not True
+            ]
+            if failed:
+                return failed
+        return []
+    finally:
+        for task in tasks:
+            task.cancel()
 
 
 async def run_league(config: LeagueConfig) -> int:
@@ -125,7 +283,7 @@ async def run_league(config: LeagueConfig) -> int:
     agents: List[AgentProcess] = []
     manager: Optional[LeagueManager] = None
     
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(limits=_CLIENT_LIMITS, timeout=_CLIENT_TIMEOUT) as client:
         try:
             # Print banner
             logger.info("")
@@ -162,8 +320,15 @@ async def run_league(config: LeagueConfig) -> int:
                     return 1
             
             # Wait for league manager to be ready (async)
+            manager_probe = client.build_request(
+                "GET",
+                _LOOPBACK_URL.copy_with(port=config.port, path="/health"),
+                timeout=_PROBE_TIMEOUT
+            )
             server_ready = False
-            for i in range(20):
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 5.0
+            while loop.time() < deadline:
                 # Check if server task has failed during startup
                 if server_task.done():
                     try:
@@ -173,13 +338,14 @@ async def run_league(config: LeagueConfig) -> int:
                         return 1
                 
                 try:
-                    resp = await client.get(f"{league_url}/health", timeout=0.5)
+                    resp = await client.send(manager_probe)
                     if resp.status_code == 200:
                         logger.info(f"  ✓ League Manager ready on port {config.port}")
                         server_ready = True
                         break
                 except Exception:
-                    await asyncio.sleep(0.25)
+                    pass
+                await asyncio.sleep(0.05)
             
             if not server_ready:
                 logger.error("  ✗ League Manager failed to start (timeout)")
@@ -221,17 +387,26 @@ async def run_league(config: LeagueConfig) -> int:
             logger.info("")
             logger.info("Starting Agents...")
             
+            # Launch every agent first so they initialize concurrently
             for i in range(config.num_agents):
                 port = config.base_agent_port + i
                 name = agent_names[i] if i < len(agent_names) else f"Agent{i+1}"
                 strategy = strategies[i % len(strategies)]  # Rotate through strategies
                 
-                agent = AgentProcess(port, name, league_url, strategy)
-                if await agent.start(client):
-                    agents.append(agent)
-                else:
+                agent = AgentProcess(
+                    port, name, league_url, strategy,
+                    capture_output=config.log_level == "DEBUG"
+                )
+                if not await agent.spawn():
                     logger.error(f"Failed to start agent {name}")
                     return 1
+                agents.append(agent)
+            
+            # Then wait for all of them to pass their health checks together
+            failed = await _await_all_ready(agents, client, manager)
+            if failed:
+                logger.error(f"Failed to start agent(s): {', '.join(failed)}")
+                return 1
             
             logger.info(f"\n✓ All {len(agents)} agents started successfully")
             
@@ -239,17 +414,11 @@ async def run_league(config: LeagueConfig) -> int:
             logger.info("")
             logger.info("Waiting for agents to register with League Manager...")
             
-            for _ in range(30):  # 15 seconds timeout
-                try:
-                    resp = await client.get(f"{league_url}/agents", timeout=1.0)
-                    if resp.status_code == 200:
-                        data = resp.json()
-                        if len(data.get("agents", [])) >= config.num_agents:
-                            logger.info(f"  ✓ All {config.num_agents} agents registered")
-                            break
-                except Exception:
-                    pass
-                await asyncio.sleep(0.5)
+            # Healthy agents may still be retrying registration (the readiness
+            # wait above gives up on it quickly), so allow the stragglers a
+            # moment; the manager runs in this process, so check its registry
+            if await manager.wait_for_agents(config.num_agents, timeout=5.0):
+                logger.info(f"  ✓ All {config.num_agents} agents registered")
             else:
                 logger.warning(f"Only {len(manager.agents)} agents registered, proceeding anyway")
             
@@ -269,10 +438,6 @@ async def run_league(config: LeagueConfig) -> int:
             
             return 0
             
-        except KeyboardInterrupt:
-            logger.info("\n\nLeague interrupted by user")
-            return 130
-            
         except Exception as e:
             logger.error(f"\nLeague error: {e}", exc_info=True)
             return 1
@@ -282,9 +447,10 @@ async def run_league(config: LeagueConfig) -> int:
             logger.info("")
             logger.info("Shutting down...")
             
-            # Stop agents
+            # Stop agents: signal all of them, then wait for them together
             for agent in agents:
-                agent.stop()
+                agent.signal_terminate()
+            await asyncio.gather(*(agent.await_exit() for agent in agents), return_exceptions=True)
             
             # Stop manager
             if manager:
@@ -293,6 +459,38 @@ async def run_league(config: LeagueConfig) -> int:
             logger.info("✓ Cleanup complete")
 
 
+async def _run_until_interrupted(config: LeagueConfig) -> int:
+    """Run the league, turning Ctrl+C into a single cancellation.
+    
+    The first SIGINT cancels the league task once; the resulting
+    CancelledError is the intended shutdown and is reported as an interrupt
+    (exit code 130) rather than a traceback. Further presses are ignored
+    while run_league cleans up.
+    """
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    interrupted = False
+    
+    def on_sigint():
+        nonlocal interrupted
+        if not interrupted:
+            interrupted = True
+            main_task.cancel()
+    
+    try:
+        loop.add_signal_handler(signal.SIGINT, on_sigint)
+    except NotImplementedError:  # pragma: no cover - e.g. Windows event loops
+        pass
+    
+    try:
+        return await run_league(config)
+    except asyncio.CancelledError:
+        if not interrupted:
+            raise
+        logger.info("\n\nLeague interrupted by user")
+        return 130
+
+
 def main() -> int:
     """Main entrypoint."""
     # Parse configuration
@@ -301,11 +499,6 @@ def main() -> int:
     # Setup logging
     setup_logging(config.log_level)
     
-    # Add filter to suppress CancelledError on shutdown
-    error_filter = SuppressCancelledErrorFilter()
-    logging.getLogger("uvicorn.error").addFilter(error_filter)
-    logging.getLogger("uvicorn").addFilter(error_filter)
-    
     # Log configuration
     logger.info("League Configuration:")
     logger.info(f"  Manager Port: {config.port}")
@@ -317,8 +510,15 @@ def main() -> int:
     logger.info(f"  Rounds per Matchup: {config.rounds}")
     logger.info(f"  Log Level: {config.log_level}")
     
-    # Run the league
-    return asyncio.run(run_league(config))
+    # Run the league, on uvloop when uvicorn[standard] has installed it
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
+    return asyncio.run(_run_until_interrupted(config))
 
 
 if __name__ == "__main__":
@@ -26,6 +26,17 @@ class LeagueConfig:
         return f"http://127.0.0.1:{self.port}{self.registration_path}"
 
 
+# Environment fallbacks for options not given on the command line:
+# option name -> (variable, default, converter)
+_ENV_DEFAULTS = {
+    "port": ("LEAGUE_PORT", "9000", int),
+    "num_agents": ("NUM_AGENTS", "4", int),
+    "base_agent_port": ("BASE_AGENT_PORT", "8001", int),
+    "rounds": ("ROUNDS", "3", int),
+    "log_level": ("LOG_LEVEL", "INFO", str),
+}
+
+
 def parse_league_args() -> LeagueConfig:
     """Parse CLI arguments for league manager."""
     parser = argparse.ArgumentParser(
@@ -33,8 +44,8 @@ def parse_league_args() -> LeagueConfig:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python -m league --port 9000 --num-agents 4 --rounds 10
-  python -m league --port 9000 --num-agents 4 --base-agent-port 8001 --rounds 5
+  python -m agents.league_manager --port 9000 --num-agents 4 --rounds 10
+  python -m agents.league_manager --port 9000 --num-agents 4 --base-agent-port 8001 --rounds 5
 
 Environment Variables:
   LEAGUE_PORT       Manager port (default: 9000)
@@ -48,31 +59,31 @@ Environment Variables:
     parser.add_argument(
         "--port",
         type=int,
-        default=int(os.getenv("LEAGUE_PORT", "9000")),
+        default=argparse.SUPPRESS,
         help="Port for league manager server"
     )
     parser.add_argument(
         "--num-agents",
         type=int,
-        default=int(os.getenv("NUM_AGENTS", "4")),
+        default=argparse.SUPPRESS,
         help="Number of agents to spawn"
     )
     parser.add_argument(
         "--base-agent-port",
         type=int,
-        default=int(os.getenv("BASE_AGENT_PORT", "8001")),
+        default=argparse.SUPPRESS,
         help="Base port for agents (will use consecutive ports)"
     )
     parser.add_argument(
         "--rounds",
         type=int,
-        default=int(os.getenv("ROUNDS", "3")),
+        default=argparse.SUPPRESS,
         help="Number of rounds per matchup"
     )
     parser.add_argument(
         "--log-level",
         type=str,
-        default=os.getenv("LOG_LEVEL", "INFO"),
+        default=argparse.SUPPRESS,
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Logging level"
     )
@@ -87,14 +98,16 @@ Environment Variables:
         help="Use external referee server instead of embedded referee"
     )
     
-    args = parser.parse_args()
+    args = vars(parser.parse_args())
     
-    return LeagueConfig(
-        port=args.port,
-        num_agents=args.num_agents,
-        base_agent_port=args.base_agent_port,
-        rounds=args.rounds,
-        log_level=args.log_level,
-        server_only=args.server_only,
-        use_external_referee=args.use_external_referee
-    )
+    # Options left off the command line fall back to the environment, read
+    # only now and reported through argparse if malformed
+    for dest, (var, default, convert) in _ENV_DEFAULTS.items():
+        if dest not in args:
+            raw = os.getenv(var, default)
+            try:
+                args[dest] = convert(raw)
+            except ValueError:
+                parser.error(f"invalid value for {var}: {raw!r}")
+    
+    return LeagueConfig(**args)
@@ -7,26 +7,31 @@ The League Manager:
 4. Runs multiple rounds of competition
 """
 import asyncio
-import json
 import logging
 import signal
 import sys
 import uuid
 from dataclasses import dataclass, field
-from itertools import combinations
-from typing import Optional
+from typing import Optional, Sequence
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, Response
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 import uvicorn
 import httpx
 
 from agents.referee.referee import Agent, Referee, GameResult
+from shared.http import ORJSONResponse, dumps
+from shared.models import RegisterRequest
 
 logger = logging.getLogger(__name__)
 
+# Column headers for the standings tables written to the log
+_STANDINGS_HEADER = f"{'Rank':<5} {'Agent':<15} {'Pts':<5} {'W':<4} {'L':<4} {'D':<4}"
+_FINAL_STANDINGS_HEADER = f"{'Rank':<6} {'Agent':<15} {'Points':<8} {'W-L-D':<12} {'Win Rate':<10}"
 
-@dataclass
+
+@dataclass(slots=True)
 class Standing:
     """Agent standings in the league."""
     
@@ -34,18 +39,9 @@ class Standing:
     losses: int = 0
     draws: int = 0
     games_played: int = 0
-    
-    @property
-    def points(self) -> int:
-        """Calculate points (3 for win, 1 for draw, 0 for loss)."""
-        return (self.wins * 3) + self.draws
-    
-    @property
-    def win_rate(self) -> float:
-        """Calculate win rate."""
-        if self.games_played == 0:
-            return 0.0
-        return self.wins / self.games_played
+    # Derived from the counters above; refreshed by LeagueManager._record_results
+    points: int = 0  # 3 for a win, 1 for a draw, 0 for a loss
+    win_rate: float = 0.0
 
 
 @dataclass
@@ -58,27 +54,93 @@ class LeagueStats:
     game_history: list[GameResult] = field(default_factory=list)
 
 
+def _round_robin_schedule(agents: list[Agent]) -> list[list[tuple[Agent, Agent]]]:
+    """Split a round robin into slots of disjoint pairs (circle method).
+    
+    With n agents this yields n - 1 slots (n when n is odd, one agent
+    sitting out each slot) and every pair appears in exactly one slot.
+    
+    Args:
+        agents: Agents taking part
+    
+    Returns:
+        List of slots, each a list of (player1, player2) pairs
+    """
+    ring: list[Optional[Agent]] = list(agents)
+    if len(ring) % 2:
+        ring.append(None)  # bye
+    
+    n = len(ring)
+    schedule = []
+    for _ in range(n - 1):
+        slot = []
+        for i in range(n // 2):
+            player1, player2 = ring[i], ring[n - 1 - i]
+            if player1 is not None and player2 is not None:
+                slot.append((player1, player2))
+        schedule.append(slot)
+        # Keep the first agent fixed and rotate the rest one step
+        ring = [ring[0], ring[-1]] + ring[1:-1]
+    
+    return schedule
+
+
+class _NotifyingServer(uvicorn.Server):
+    """Uvicorn server that sets an event once its listening sockets are bound."""
+    
+    def __init__(self, config: uvicorn.Config, ready: asyncio.Event):
+        super().__init__(config)
+        self._ready = ready
+    
+    async def startup(self, sockets=None):
+        await super().startup(sockets)
+        if self.started:
+            self._ready.set()
+
+
 class LeagueManager:
     """Central league manager server."""
     
-    def __init__(self, port: int, rounds: int = 3, use_external_referee: bool = False):
+    def __init__(
+        self,
+        port: int,
+        rounds: int = 3,
+        use_external_referee: bool = False,
+        max_parallel_games: int = 16
+    ):
         """Initialize league manager.
         
         Args:
             port: Port to run the server on
             rounds: Number of rounds for each matchup
             use_external_referee: If True, use external referee via JSON-RPC; if False, use embedded referee
+            max_parallel_games: Maximum number of games played at the same time within a round
         """
         self.port = port
         self.rounds = rounds
+        self.max_parallel_games = max_parallel_games
         self.agents: dict[str, Agent] = {}
         self.stats = LeagueStats()
         self.use_external_referee = use_external_referee
         self.referee_endpoint: Optional[str] = None  # External referee endpoint
-        self.referee = Referee(timeout=5.0) if not use_external_referee else None  # Embedded referee (legacy)
+        # One connection pool for every outbound call (players and external referee)
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=2 * max_parallel_games)
+        )
+        # Embedded referee (legacy)
+        self.referee = None if use_external_referee else Referee(timeout=5.0, client=self._http)
         self._running = False
         self._league_running = False
         self._server: Optional[uvicorn.Server] = None
+        # Set (and replaced) whenever a player registers / a game result is recorded
+        self._agent_registered = asyncio.Event()
+        self._game_recorded = asyncio.Event()
+        # Sorted standings and /standings body, rebuilt when marked dirty
+        self._standings_dirty = True
+        self._standings_cache: list[tuple[str, Standing]] = []
+        self._standings_body: Optional[bytes] = None
+        # Serialized /agents body, dropped whenever a player registers
+        self._agents_body: Optional[bytes] = None
         
         # Create FastAPI app
         self.app = self._create_app()
@@ -90,7 +152,8 @@ class LeagueManager:
             description="Parity Game League Manager",
             version="1.0.0",
             docs_url=None,
-            redoc_url=None
+            redoc_url=None,
+            default_response_class=ORJSONResponse
         )
         
         @app.get("/health")
@@ -102,93 +165,91 @@ class LeagueManager:
                 "total_games": self.stats.total_games
             }
         
+        @app.exception_handler(RequestValidationError)
+        async def validation_error(request: Request, exc: RequestValidationError):
+            """Report bad /register bodies as 400 errors; other routes keep the 422."""
+            if request.url.path != "/register":
+                return await request_validation_exception_handler(request, exc)
+            
+            errors = exc.errors()
+            if any(error["type"] == "json_invalid" for error in errors):
+                return ORJSONResponse(content={"error": "Invalid JSON"}, status_code=400)
+            
+            missing = [error["loc"][-1] for error in errors if error["type"] == "missing"]
+            if missing:
+                message = f"Missing required fields: {missing}"
+            else:
+                message = "; ".join(f"{error['loc'][-1]}: {error['msg']}" for error in errors)
+            return ORJSONResponse(content={"error": message}, status_code=400)
+        
         @app.post("/register")
-        async def register(request: Request):
+        async def register(data: RegisterRequest):
             """Handle agent registration (players and referee)."""
-            try:
-                data = await request.json()
-                
-                # Validate required fields
-                required_fields = ["display_name", "version", "endpoint"]
-                missing = [f for f in required_fields if f not in data]
-                
-                if missing:
-                    return JSONResponse(
-                        content={"error": f"Missing required fields: {missing}"},
-                        status_code=400
-                    )
-                
-                display_name = data["display_name"]
-                version = data["version"]
-                endpoint = data["endpoint"]
-                agent_type = data.get("agent_type", "player")  # "player" or "referee"
-                
-                # Handle referee registration
-                if agent_type == "referee":
-                    self.referee_endpoint = endpoint
-                    logger.info(f"✓ Registered referee: {display_name} (v{version}) at {endpoint}")
-                    return {
-                        "status": "registered",
-                        "agent_type": "referee",
-                        "message": f"Referee {display_name} registered successfully"
-                    }
-                
-                # Handle player registration
-                agent = Agent(
-                    display_name=display_name,
-                    version=version,
-                    endpoint=endpoint
-                )
-                
-                self.agents[display_name] = agent
-                
-                # Initialize standings if not exists
-                if display_name not in self.stats.standings:
-                    self.stats.standings[display_name] = Standing()
-                
-                logger.info(f"✓ Registered agent: {display_name} (v{version}) at {endpoint}")
-                
+            display_name = data.display_name
+            version = data.version
+            endpoint = data.endpoint
+            
+            # Handle referee registration
+            if data.agent_type == "referee":
+                self.referee_endpoint = endpoint
+                logger.info("✓ Registered referee: %s (v%s) at %s", display_name, version, endpoint)
                 return {
                     "status": "registered",
-                    "agent_id": f"agent_{display_name}",
-                    "message": f"Welcome to the league, {display_name}!"
+                    "agent_type": "referee",
+                    "message": f"Referee {display_name} registered successfully"
                 }
-                
-            except json.JSONDecodeError:
-                return JSONResponse(
-                    content={"error": "Invalid JSON"},
-                    status_code=400
-                )
-            except Exception as e:
-                logger.error(f"Registration error: {e}")
-                return JSONResponse(
-                    content={"error": str(e)},
-                    status_code=500
-                )
+            
+            # Handle player registration
+            agent = Agent(
+                display_name=display_name,
+                version=version,
+                endpoint=endpoint
+            )
+            
+            self.agents[display_name] = agent
+            self._agents_body = None
+            
+            # Initialize standings if not exists
+            if display_name not in self.stats.standings:
+                self.stats.standings[display_name] = Standing()
+                self._standings_dirty = True
+            
+            logger.info("✓ Registered agent: %s (v%s) at %s", display_name, version, endpoint)
+            
+            # Wake up waiters, then arm a fresh event for the next player
+            self._agent_registered.set()
+            self._agent_registered = asyncio.Event()
+            
+            return {
+                "status": "registered",
+                "agent_id": f"agent_{display_name}",
+                "message": f"Welcome to the league, {display_name}!"
+            }
         
         @app.get("/standings")
         async def standings():
             """Get current league standings."""
-            sorted_standings = sorted(
-                self.stats.standings.items(),
-                key=lambda x: (x[1].points, x[1].wins, -x[1].losses),
-                reverse=True
-            )
+            return Response(content=self._standings_response(), media_type="application/json")
+        
+        @app.get("/wait-for-agents")
+        async def wait_for_agents(count: int, timeout: float = 15.0):
+            """Block until at least `count` players have registered."""
+            ready = await self.wait_for_agents(count, timeout)
+            return {
+                "ready": ready,
+                "registered_agents": len(self.agents)
+            }
+        
+        @app.get("/wait-complete")
+        async def wait_complete(expected: int, timeout: float = 300.0):
+            """Block until at least `expected` games have been played.
             
+            Lets clients wait for the league with one request instead of
+            polling /standings.
+            """
+            complete = await self.wait_for_games(expected, timeout)
             return {
-                "standings": [
-                    {
-                        "rank": i + 1,
-                        "agent": name,
-                        "points": standing.points,
-                        "wins": standing.wins,
-                        "losses": standing.losses,
-                        "draws": standing.draws,
-                        "games_played": standing.games_played,
-                        "win_rate": f"{standing.win_rate:.1%}"
-                    }
-                    for i, (name, standing) in enumerate(sorted_standings)
-                ],
+                "complete": complete,
                 "total_games": self.stats.total_games,
                 "rounds_completed": self.stats.total_rounds_completed
             }
@@ -196,28 +257,30 @@ class LeagueManager:
         @app.get("/agents")
         async def list_agents():
             """List registered agents."""
-            return {
-                "agents": [
-                    {
-                        "display_name": agent.display_name,
-                        "version": agent.version,
-                        "endpoint": agent.endpoint
-                    }
-                    for agent in self.agents.values()
-                ]
-            }
+            if self._agents_body is None:
+                self._agents_body = dumps({
+                    "agents": [
+                        {
+                            "display_name": agent.display_name,
+                            "version": agent.version,
+                            "endpoint": agent.endpoint
+                        }
+                        for agent in self.agents.values()
+                    ]
+                })
+            return Response(content=self._agents_body, media_type="application/json")
         
         @app.post("/start")
         async def start_league():
             """Start the league competition with currently registered agents."""
             if len(self.agents) < 2:
-                return JSONResponse(
+                return ORJSONResponse(
                     content={"error": "Need at least 2 agents to start league"},
                     status_code=400
                 )
             
             if self._league_running:
-                return JSONResponse(
+                return ORJSONResponse(
                     content={"error": "League is already running"},
                     status_code=409
                 )
@@ -246,14 +309,9 @@ class LeagueManager:
         """
         # Wait for agents if specified
         if wait_for_agents > 0:
-            logger.info(f"Waiting for {wait_for_agents} agents to register (timeout: {wait_timeout}s)...")
-            waited = 0
-            while len(self.agents) < wait_for_agents and waited < wait_timeout:
-                await asyncio.sleep(0.5)
-                waited += 0.5
-            
-            if len(self.agents) < wait_for_agents:
-                logger.warning(f"Only {len(self.agents)}/{wait_for_agents} agents registered")
+            logger.info("Waiting for %d agents to register (timeout: %ss)...", wait_for_agents, wait_timeout)
+            if not await self.wait_for_agents(wait_for_agents, wait_timeout):
+                logger.warning("Only %d/%d agents registered", len(self.agents), wait_for_agents)
         
         if len(self.agents) < 2:
             logger.error("Need at least 2 agents to run a league")
@@ -263,40 +321,41 @@ class LeagueManager:
         logger.info("=" * 60)
         logger.info("STARTING LEAGUE COMPETITION")
         logger.info("=" * 60)
-        logger.info(f"Registered agents: {list(self.agents.keys())}")
-        logger.info(f"Rounds per matchup: {self.rounds}")
+        logger.info("Registered agents: %s", list(self.agents))
+        logger.info("Rounds per matchup: %d", self.rounds)
         logger.info("")
         
-        # Get all matchups (each pair plays)
-        agent_list = list(self.agents.values())
-        matchups = list(combinations(agent_list, 2))
+        # Every pair plays once per round, split into slots of disjoint pairs
+        schedule = _round_robin_schedule(list(self.agents.values()))
+        total_matchups = sum(len(slot) for slot in schedule)
         
-        logger.info(f"Total matchups: {len(matchups)}")
-        logger.info(f"Total games: {len(matchups) * self.rounds}")
+        logger.info("Total matchups: %d", total_matchups)
+        logger.info("Total games: %d", total_matchups * self.rounds)
         logger.info("")
         
+        # No agent appears twice in a slot, so a slot's games can all overlap
+        semaphore = asyncio.Semaphore(self.max_parallel_games)
+        
+        async def play(player1: Agent, player2: Agent) -> GameResult:
+            async with semaphore:
+                return await self._run_game(player1, player2)
+        
         # Run all matchups
         for round_num in range(self.rounds):
-            logger.info(f"\n{'='*60}")
-            logger.info(f"ROUND {round_num + 1} of {self.rounds}")
-            logger.info(f"{'='*60}")
+            logger.info("\n%s", "=" * 60)
+            logger.info("ROUND %d of %d", round_num + 1, self.rounds)
+            logger.info("=" * 60)
             
-            for player1, player2 in matchups:
-                # Run game via referee (external or embedded)
-                if self.use_external_referee:
-                    result = await self._run_game_via_external_referee(player1, player2)
-                elif self.referee is not None:
-                    result = await self.referee.run_game(player1, player2)
-                else:
-                    raise RuntimeError("No referee available (neither external nor embedded)")
-                
-                self._record_result(result)
-                self.stats.game_history.append(result)
+            for slot_num, slot in enumerate(schedule, 1):
+                results = await asyncio.gather(
+                    *(play(player1, player2) for player1, player2 in slot)
+                )
                 
-                # Brief pause between games
-                await asyncio.sleep(0.1)
-            
-            self.stats.total_rounds_completed = round_num + 1
+                self._record_results(results)
+                self.stats.game_history.extend(results)
+                if slot_num == len(schedule):
+                    self.stats.total_rounds_completed = round_num + 1
+                self._notify_game_recorded()
             
             # Show standings after each round
             self._print_standings()
@@ -309,6 +368,66 @@ class LeagueManager:
         
         return self._get_final_standings()
     
+    async def wait_for_agents(self, count: int, timeout: float) -> bool:
+        """Wait until at least `count` players have registered.
+        
+        Args:
+            count: Number of players to wait for
+            timeout: Maximum time to wait in seconds
+        
+        Returns:
+            True if enough players registered, False on timeout
+        """
+        async def _wait():
+            while len(self.agents) < count:
+                await self._agent_registered.wait()
+        
+        try:
+            await asyncio.wait_for(_wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def wait_for_agent(self, name: str, timeout: float) -> bool:
+        """Wait until the player `name` has registered.
+        
+        Args:
+            name: Display name of the player
+            timeout: Maximum time to wait in seconds
+        
+        Returns:
+            True if the player registered, False on timeout
+        """
+        async def _wait():
+            while name not in self.agents:
+                await self._agent_registered.wait()
+        
+        try:
+            await asyncio.wait_for(_wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def wait_for_games(self, expected: int, timeout: float) -> bool:
+        """Wait until at least `expected` games have been recorded.
+        
+        Args:
+            expected: Number of games to wait for
+            timeout: Maximum time to wait in seconds
+        
+        Returns:
+            True if the game count was reached, False on timeout
+        """
+        async def _wait():
+            while self.stats.total_games < expected:
+                await self._game_recorded.wait()
+        
+        try:
+            await asyncio.wait_for(_wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
     async def _run_league_background(self):
         """Run league in background (wrapper for API endpoint)."""
         try:
@@ -316,11 +435,19 @@ class LeagueManager:
             logger.info("League started via API endpoint")
             await self.run_league(wait_for_agents=0)
         except Exception as e:
-            logger.error(f"Error running league: {e}", exc_info=True)
+            logger.error("Error running league: %s", e, exc_info=True)
         finally:
             self._league_running = False
             logger.info("League completed")
     
+    async def _run_game(self, player1: Agent, player2: Agent) -> GameResult:
+        """Run a single game via the external or embedded referee."""
+        if self.use_external_referee:
+            return await self._run_game_via_external_referee(player1, player2)
+        if self.referee is not None:
+            return await self.referee.run_game(player1, player2)
+        raise RuntimeError("No referee available (neither external nor embedded)")
+    
     async def _run_game_via_external_referee(self, player1: Agent, player2: Agent) -> GameResult:
         """Run a game via external referee MCP server.
         
@@ -360,35 +487,34 @@ class LeagueManager:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.referee_endpoint,
-                    json=payload,
-                    timeout=60.0  # Long timeout for match execution
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                if "error" in data:
-                    error = data["error"]
-                    raise RuntimeError(f"Referee error: {error.get('message', 'Unknown error')}")
-                
-                result = data.get("result", {})
-                
-                # Convert result dict back to GameResult
-                return GameResult(
-                    game_id=result.get("game_id", "unknown"),
-                    player1=result.get("player1", player1.display_name),
-                    player2=result.get("player2", player2.display_name),
-                    player1_choice=result.get("player1_choice", "none"),
-                    player2_choice=result.get("player2_choice", "none"),
-                    dice_roll=result.get("dice_roll", 0),
-                    dice_parity=result.get("dice_parity", "none"),
-                    winner=result.get("winner")
-                )
-                
+            response = await self._http.post(
+                self.referee_endpoint,
+                json=payload,
+                timeout=60.0  # Long timeout for match execution
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if "error" in data:
+                error = data["error"]
+                raise RuntimeError(f"Referee error: {error.get('message', 'Unknown error')}")
+            
+            result = data.get("result", {})
+            
+            # Convert result dict back to GameResult
+            return GameResult(
+                game_id=result.get("game_id", "unknown"),
+                player1=result.get("player1", player1.display_name),
+                player2=result.get("player2", player2.display_name),
+                player1_choice=result.get("player1_choice", "none"),
+                player2_choice=result.get("player2_choice", "none"),
+                dice_roll=result.get("dice_roll", 0),
+                dice_parity=result.get("dice_parity", "none"),
+                winner=result.get("winner")
+            )
+            
         except Exception as e:
-            logger.error(f"Error calling external referee: {e}")
+            logger.error("Error calling external referee: %s", e)
             # Return a default result on error
             return GameResult(
                 game_id=match_id,
@@ -403,82 +529,122 @@ class LeagueManager:
     
     def _record_result(self, result: GameResult):
         """Record a game result in standings."""
-        self.stats.total_games += 1
-        
-        # Update player 1 stats
-        if result.player1 in self.stats.standings:
-            s1 = self.stats.standings[result.player1]
-            s1.games_played += 1
-            if result.winner == result.player1:
-                s1.wins += 1
-            elif result.winner == result.player2:
-                s1.losses += 1
-            else:
-                s1.draws += 1
-        
-        # Update player 2 stats
-        if result.player2 in self.stats.standings:
-            s2 = self.stats.standings[result.player2]
-            s2.games_played += 1
-            if result.winner == result.player2:
-                s2.wins += 1
-            elif result.winner == result.player1:
-                s2.losses += 1
-            else:
-                s2.draws += 1
+        self._record_results((result,))
+    
+    def _record_results(self, results: Sequence[GameResult]):
+        """Record a batch of game results in standings in one pass."""
+        standings = self.stats.standings
+        for result in results:
+            sides = ((result.player1, result.player2), (result.player2, result.player1))
+            for player, opponent in sides:
+                standing = standings.get(player)
+                if standing is None:
+                    continue
+                standing.games_played += 1
+                if result.winner == player:
+                    standing.wins += 1
+                elif result.winner == opponent:
+                    standing.losses += 1
+                else:
+                    standing.draws += 1
+                standing.points = standing.wins * 3 + standing.draws
+                standing.win_rate = standing.wins / standing.games_played
+        
+        self.stats.total_games += len(results)
+        self._standings_dirty = True
+    
+    def _notify_game_recorded(self):
+        """Wake up /wait-complete waiters after a game is fully recorded."""
+        # Set the current event, then arm a fresh one for the next game
+        self._game_recorded.set()
+        self._game_recorded = asyncio.Event()
+    
+    def _sorted_standings(self) -> list[tuple[str, Standing]]:
+        """Standings ordered by points, wins and fewest losses.
+        
+        The sorted list and the /standings body are rebuilt only after
+        something marked the standings dirty.
+        """
+        if self._standings_dirty:
+            self._standings_cache = sorted(
+                self.stats.standings.items(),
+                key=lambda x: (x[1].points, x[1].wins, -x[1].losses),
+                reverse=True
+            )
+            self._standings_body = None
+            self._standings_dirty = False
+        return self._standings_cache
+    
+    def _standings_response(self) -> bytes:
+        """Serialized /standings body, cached until standings change."""
+        sorted_standings = self._sorted_standings()
+        if self._standings_body is None:
+            self._standings_body = dumps({
+                "standings": [
+                    {
+                        "rank": i + 1,
+                        "agent": name,
+                        "points": standing.points,
+                        "wins": standing.wins,
+                        "losses": standing.losses,
+                        "draws": standing.draws,
+                        "games_played": standing.games_played,
+                        "win_rate": f"{standing.win_rate:.1%}"
+                    }
+                    for i, (name, standing) in enumerate(sorted_standings)
+                ],
+                "total_games": self.stats.total_games,
+                "rounds_completed": self.stats.total_rounds_completed
+            })
+        return self._standings_body
     
     def _print_standings(self):
         """Print current standings to log."""
-        sorted_standings = sorted(
-            self.stats.standings.items(),
-            key=lambda x: (x[1].points, x[1].wins),
-            reverse=True
-        )
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        sorted_standings = self._sorted_standings()
         
         logger.info("")
         logger.info("Current Standings:")
         logger.info("-" * 50)
-        logger.info(f"{'Rank':<5} {'Agent':<15} {'Pts':<5} {'W':<4} {'L':<4} {'D':<4}")
+        logger.info(_STANDINGS_HEADER)
         logger.info("-" * 50)
         
         for i, (name, standing) in enumerate(sorted_standings):
             logger.info(
-                f"{i+1:<5} {name:<15} {standing.points:<5} "
-                f"{standing.wins:<4} {standing.losses:<4} {standing.draws:<4}"
+                "%-5d %-15s %-5d %-4d %-4d %-4d",
+                i + 1, name, standing.points, standing.wins, standing.losses, standing.draws
             )
     
     def _print_final_standings(self):
         """Print final standings."""
-        sorted_standings = sorted(
-            self.stats.standings.items(),
-            key=lambda x: (x[1].points, x[1].wins),
-            reverse=True
-        )
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        sorted_standings = self._sorted_standings()
         
         logger.info("")
         logger.info("FINAL STANDINGS")
         logger.info("=" * 60)
-        logger.info(f"{'Rank':<6} {'Agent':<15} {'Points':<8} {'W-L-D':<12} {'Win Rate':<10}")
+        logger.info(_FINAL_STANDINGS_HEADER)
         logger.info("-" * 60)
         
         for i, (name, standing) in enumerate(sorted_standings):
-            wld = f"{standing.wins}-{standing.losses}-{standing.draws}"
-            wr = f"{standing.win_rate:.1%}"
-            logger.info(f"{i+1:<6} {name:<15} {standing.points:<8} {wld:<12} {wr:<10}")
+            logger.info(
+                "%-6d %-15s %-8d %-12s %-10s",
+                i + 1, name, standing.points,
+                f"{standing.wins}-{standing.losses}-{standing.draws}",
+                f"{standing.win_rate:.1%}"
+            )
         
         logger.info("=" * 60)
         
         if sorted_standings:
             winner = sorted_standings[0][0]
-            logger.info(f"\n🏆 CHAMPION: {winner} 🏆")
+            logger.info("\n🏆 CHAMPION: %s 🏆", winner)
     
     def _get_final_standings(self) -> dict:
         """Get final standings as dict."""
-        sorted_standings = sorted(
-            self.stats.standings.items(),
-            key=lambda x: (x[1].points, x[1].wins),
-            reverse=True
-        )
+        sorted_standings = self._sorted_standings()
         
         return {
             "standings": [
@@ -544,8 +710,8 @@ class LeagueManager:
             # Ensure we don't propagate the error
             self._running = False
     
-    async def start_server_background(self):
-        """Start the server in the background (returns immediately)."""
+    async def start_server_background(self, timeout: float = 10.0):
+        """Start the server in the background (returns once it is accepting connections)."""
         config = uvicorn.Config(
             app=self.app,
             host="127.0.0.1",
@@ -553,26 +719,30 @@ class LeagueManager:
             log_level="warning",
             access_log=False
         )
-        self._server = uvicorn.Server(config)
+        ready = asyncio.Event()
+        self._server = _NotifyingServer(config, ready)
         self._running = True
         
         logger.info(f"League Manager starting on http://127.0.0.1:{self.port}")
         
-        # Start server in background task
-        asyncio.create_task(self._server.serve())
-        
-        # Wait for server to be ready
-        import httpx
-        for _ in range(40):  # Up to 10 seconds
+        async def serve():
             try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(f"http://127.0.0.1:{self.port}/health", timeout=0.5)
-                    if resp.status_code == 200:
-                        logger.info(f"League Manager ready on http://127.0.0.1:{self.port}")
-                        return True
-            except Exception:
-                await asyncio.sleep(0.25)
+                await self._server.serve()
+            except SystemExit:
+                # uvicorn exits when it cannot bind; surface that as a failed start
+                pass
+        
+        # Start server in background task and wait for its socket to be bound
+        serve_task = asyncio.create_task(serve())
+        ready_task = asyncio.create_task(ready.wait())
+        await asyncio.wait({serve_task, ready_task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        ready_task.cancel()
         
+        if ready.is_set():
+            logger.info(f"League Manager ready on http://127.0.0.1:{self.port}")
+            return True
+        
+        self._running = False
         logger.error("League Manager failed to start")
         return False
     
@@ -582,3 +752,4 @@ class LeagueManager:
             self._running = False
             self._server.should_exit = True
             logger.info("League Manager stopped")
+        await self._http.aclose()
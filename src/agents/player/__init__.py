@@ -4,31 +4,48 @@ __version__ = "1.0.0"
 
 import logging
 import sys
+from typing import Optional
+
+# Shared formatter: timestamp, level, logger name and message
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# Level and handler installed by the last setup_logging() call
+_configured_level: Optional[str] = None
+_console_handler: Optional[logging.Handler] = None
 
 
 def setup_logging(level: str = "INFO") -> None:
     """Configure structured logging.
     
+    Repeated calls with the same level are no-ops while our handler is
+    still installed on the root logger.
+    
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
     """
-    # Create formatter with timestamp, level, and message
-    formatter = logging.Formatter(
-        fmt="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    global _configured_level, _console_handler
     
-    # Configure root logger
+    level = level.upper()
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, level.upper()))
+    if level == _configured_level and _console_handler in root_logger.handlers:
+        return
+    
+    # Configure root logger
+    root_logger.setLevel(getattr(logging, level))
     
     # Remove existing handlers
     root_logger.handlers.clear()
     
     # Add console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     root_logger.addHandler(console_handler)
     
     # Reduce noise from uvicorn
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+    
+    _configured_level = level
+    _console_handler = console_handler
@@ -4,29 +4,72 @@ Provides:
 - POST /mcp: JSON-RPC 2.0 endpoint
 - GET /health: Health check endpoint
 """
+import asyncio
 import logging
 from typing import Any, Optional, cast
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, Response
-from fastapi.responses import JSONResponse
 
 from shared.jsonrpc import (
-    parse_request,
-    create_success_response,
+    decode_message,
+    validate_request,
+    encode_success_response,
     create_error_response,
+    invalid_request_error,
     method_not_found_error,
     internal_error,
     JSONRPCError,
     JSONRPCRequest,
 )
+from shared.http import ORJSONResponse
 from agents.player.registration import init_registration, stop_registration
+from agents.player.tools import METHOD_REGISTRY, dispatch_method, dispatch_batch
 
 logger = logging.getLogger(__name__)
 
 # Store config for lifespan
 _app_config: Optional[Any] = None
 
+# Strong references to in-flight notification tasks so they are not
+# garbage-collected before they finish
+_pending_notifications: set[asyncio.Task] = set()
+
+# Health probes are frequent and the body never changes
+_HEALTH_BODY = b'{"ok":true}'
+
+
+async def _run_notification(method: str, params: dict | list | None) -> None:
+    """Run a notification's handler off the request path.
+    
+    Handlers are synchronous, so they run in a worker thread; agent state
+    is lock-protected.
+    """
+    try:
+        await asyncio.to_thread(dispatch_method, method, params)
+    except Exception as e:
+        logger.error("Error processing notification: %s", e, exc_info=True)
+
+
+def _batch_response(batch: list) -> Response:
+    """Answer a JSON-RPC batch request.
+    
+    Args:
+        batch: Decoded batch array
+    """
+    if not batch:
+        err = invalid_request_error("Batch must not be empty")
+        logger.warning("Invalid JSON-RPC request: %s", err.data)
+        return ORJSONResponse(create_error_response(None, err))
+    
+    logger.info("JSON-RPC batch request: %d entries", len(batch))
+    responses = dispatch_batch(batch)
+    
+    # A batch of only notifications gets no response body
+    if not responses:
+        return Response(status_code=204)
+    return ORJSONResponse(responses)
+
 
 def create_app(config: Optional[Any] = None) -> FastAPI:
     """Create and configure FastAPI application.
@@ -66,19 +109,19 @@ def create_app(config: Optional[Any] = None) -> FastAPI:
         docs_url=None,  # Disable docs in production
         redoc_url=None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     @app.get("/health")
-    async def health() -> dict[str, bool]:
+    async def health() -> Response:
         """Health check endpoint.
         
         Returns:
             {"ok": true} if server is running
         """
-        return {"ok": True}
+        return Response(_HEALTH_BODY, media_type="application/json")
     
-    @app.post("/mcp", response_model=None)
-    async def mcp_endpoint(request: Request):
+    async def mcp_endpoint(request: Request) -> Response:
         """MCP JSON-RPC 2.0 endpoint.
         
         Accepts JSON-RPC 2.0 requests and dispatches to appropriate handlers.
@@ -86,18 +129,27 @@ def create_app(config: Optional[Any] = None) -> FastAPI:
         request_id: Optional[int | str] = None
         
         try:
-            # Read raw body
+            # Read raw body once; decode_message does the only JSON decode.
+            # (A `body: bytes = Body(...)` parameter would make FastAPI
+            # decode JSON bodies itself and reject parse errors with 422.)
             body = await request.body()
             
-            # Parse and validate JSON-RPC request
-            rpc_request, error = parse_request(body)
+            # Parse JSON; a top-level array is a batch
+            data, error = decode_message(body)
+            if error is None and isinstance(data, list):
+                return _batch_response(data)
+            
+            # Validate JSON-RPC request
+            rpc_request = None
+            if error is None:
+                rpc_request, error = validate_request(data)
             
             # If parsing failed, return error
             if error is not None or rpc_request is None:
                 err = error if error is not None else internal_error(ValueError("Parse failed"))
                 response = create_error_response(None, err)
-                logger.warning(f"Invalid JSON-RPC request: {err.message}")
-                return JSONResponse(content=response)
+                logger.warning("Invalid JSON-RPC request: %s", err.message)
+                return ORJSONResponse(response)
             
             # Cast to ensure type checker knows it's not None
             req: JSONRPCRequest = rpc_request
@@ -107,45 +159,48 @@ def create_app(config: Optional[Any] = None) -> FastAPI:
             method = req.method
             params = req.params
             
-            logger.info(f"JSON-RPC request: method={method}, id={request_id}")
+            logger.info("JSON-RPC request: method=%s, id=%s", method, request_id)
             
             # Check if this is a notification (no response needed)
             if req.is_notification:
-                logger.info(f"Notification received (no response): method={method}")
-                # Still process the method, just don't respond
-                try:
-                    from agents.player.tools import dispatch_method
-                    dispatch_method(method, params)
-                except Exception as e:
-                    logger.error(f"Error processing notification: {e}", exc_info=True)
+                logger.info("Notification received (no response): method=%s", method)
+                # Still process the method, but reply before it runs
+                task = asyncio.create_task(_run_notification(method, params))
+                _pending_notifications.add(task)
+                task.add_done_callback(_pending_notifications.discard)
                 return Response(status_code=204)  # No content
             
-            # Dispatch to method handler
-            try:
-                from agents.player.tools import dispatch_method
-                result = dispatch_method(method, params)
-                response = create_success_response(request_id, result)
-                logger.info(f"Method '{method}' succeeded")
-                return JSONResponse(content=response)
-            
-            except KeyError:
-                # Method not found
+            # Unknown methods are answered directly, without raising
+            if method not in METHOD_REGISTRY:
                 err = method_not_found_error(method)
                 response = create_error_response(request_id, err)
-                logger.warning(f"Method not found: {method}")
-                return JSONResponse(content=response)
-            
-            except JSONRPCError as e:
-                # Handler raised a JSON-RPC error (e.g., invalid params)
-                response = create_error_response(request_id, e)
-                logger.warning(f"Handler error: {e.message}")
-                return JSONResponse(content=response)
+                logger.warning("Method not found: %s", method)
+                return ORJSONResponse(response)
             
+            # Dispatch to method handler
+            result = dispatch_method(method, params)
+            logger.info("Method '%s' succeeded", method)
+            return Response(
+                content=encode_success_response(request_id, result),
+                media_type="application/json",
+            )
+        
+        except JSONRPCError as e:
+            # Handler raised a JSON-RPC error (e.g., invalid params); this is
+            # an expected outcome, so no traceback is captured
+            response = create_error_response(request_id, e)
+            logger.warning("Handler error: %s", e.message)
+            return ORJSONResponse(response)
+        
         except Exception as e:
             # Catch any unexpected errors
-            logger.error(f"Unexpected error in MCP endpoint: {e}", exc_info=True)
+            logger.error("Unexpected error in MCP endpoint: %s", e, exc_info=True)
             err = internal_error(e)
             response = create_error_response(request_id, err)
-            return JSONResponse(content=response, status_code=500)
+            return ORJSONResponse(response, status_code=500)
+    
+    # Plain Starlette route: the endpoint reads the raw body itself, so
+    # FastAPI's dependency resolution and validation would be pure overhead.
+    app.add_route("/mcp", mcp_endpoint, methods=["POST"])
     
     return app
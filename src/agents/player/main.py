@@ -18,6 +18,23 @@ from agents.player.strategy import get_strategy, list_strategies
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C event loop / HTTP parser from uvicorn[standard]; fall back to
+# uvicorn's own selection when they are not installed (e.g. uvloop on Windows).
+try:
+    import uvloop  # noqa: F401
+    _UVICORN_LOOP = "uvloop"
+except ImportError:
+    _UVICORN_LOOP = "auto"
+
+try:
+    import httptools  # noqa: F401
+    _UVICORN_HTTP = "httptools"
+except ImportError:
+    _UVICORN_HTTP = "auto"
+
+# Upper bound on concurrent connections before uvicorn answers 503
+_LIMIT_CONCURRENCY = 256
+
 
 def main() -> int:
     """Main entrypoint."""
@@ -79,6 +96,12 @@ def main() -> int:
         port=config.port,
         log_level=config.log_level.lower(),
         access_log=False,  # We'll log at application level
+        loop=_UVICORN_LOOP,
+        http=_UVICORN_HTTP,
+        ws="none",  # /mcp is plain HTTP; skip loading a websocket protocol
+        interface="asgi3",
+        timeout_keep_alive=5,
+        limit_concurrency=_LIMIT_CONCURRENCY,
     )
     
     # Create server
@@ -39,9 +39,13 @@ class AgentProcess:
         self.endpoint = f"http://127.0.0.1:{port}/mcp"
         self.health_url = f"http://127.0.0.1:{port}/health"
         self.process: Optional[subprocess.Popen] = None
+        # Keep-alive connection pool shared by all calls to this agent
+        self.client = httpx.Client(
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
     
-    def start(self) -> bool:
-        """Start the agent process."""
+    def spawn(self) -> bool:
+        """Launch the agent process without waiting for it to become ready."""
         try:
             python_exe = sys.executable
             
@@ -59,26 +63,41 @@ class AgentProcess:
                 stderr=subprocess.PIPE,
                 cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             )
-            
-            # Wait for health check
-            for _ in range(30):
-                try:
-                    resp = httpx.get(self.health_url, timeout=0.5)
-                    if resp.status_code == 200:
-                        logger.info(f"  ✓ Agent '{self.name}' ready")
-                        return True
-                except Exception:
-                    time.sleep(0.5)
-            
-            logger.error(f"  ✗ Agent '{self.name}' failed to start")
-            return False
+            return True
             
         except Exception as e:
             logger.error(f"  ✗ Error starting agent '{self.name}': {e}")
             return False
     
+    def wait_ready(self, timeout: float = 10.0) -> bool:
+        """Poll the agent's health endpoint until it answers.
+        
+        Starts at 20 ms between probes and doubles up to 0.5 s, so a
+        fast-starting agent is noticed almost immediately.
+        """
+        delay = 0.02
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                resp = self.client.get(self.health_url, timeout=0.2)
+                if resp.status_code == 200:
+                    logger.info(f"  ✓ Agent '{self.name}' ready")
+                    return True
+            except httpx.HTTPError:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        
+        logger.error(f"  ✗ Agent '{self.name}' failed to start")
+        return False
+    
+    def start(self) -> bool:
+        """Start the agent process and wait until it is ready."""
+        return self.spawn() and self.wait_ready()
+    
     def stop(self):
         """Stop the agent process."""
+        self.client.close()
         if self.process:
             try:
                 self.process.terminate()
@@ -95,7 +114,7 @@ class AgentProcess:
             "params": params
         }
         
-        resp = httpx.post(self.endpoint, json=payload, timeout=5)
+        resp = self.client.post(self.endpoint, json=payload, timeout=5)
         resp.raise_for_status()
         
         data = resp.json()
@@ -193,17 +212,19 @@ async def run_selftest():
         logger.info("PHASE 2: Starting Agents")
         logger.info("=" * 60)
         
+        # Launch every agent first, then wait for all of them concurrently
         for i in range(NUM_AGENTS):
-            port = BASE_AGENT_PORT + i
-            name = AGENT_NAMES[i]
-            
-            agent = AgentProcess(port, name, league_url)
-            if agent.start():
-                agents.append(agent)
-                record_test(f"Agent {name} starts", True)
-            else:
-                record_test(f"Agent {name} starts", False, "Failed to start")
-                raise RuntimeError(f"Agent {name} failed to start")
+            agent = AgentProcess(BASE_AGENT_PORT + i, AGENT_NAMES[i], league_url)
+            agents.append(agent)
+            if not agent.spawn():
+                record_test(f"Agent {agent.name} starts", False, "Failed to start")
+                raise RuntimeError(f"Agent {agent.name} failed to start")
+        
+        ready = await asyncio.gather(*(asyncio.to_thread(a.wait_ready) for a in agents))
+        for agent, ok in zip(agents, ready):
+            record_test(f"Agent {agent.name} starts", ok, "" if ok else "Failed to start")
+        if not all(ready):
+            raise RuntimeError("Not all agents started")
         
         # ===== Phase 3: Test Registration =====
         logger.info("")
@@ -360,7 +381,7 @@ async def run_selftest():
                 "method": "unknown_method",
                 "params": {}
             }
-            resp = httpx.post(test_agent.endpoint, json=payload, timeout=5)
+            resp = test_agent.client.post(test_agent.endpoint, json=payload, timeout=5)
             data = resp.json()
             passed = (
                 "error" in data and
@@ -372,7 +393,7 @@ async def run_selftest():
         
         # Test invalid JSON
         try:
-            resp = httpx.post(
+            resp = test_agent.client.post(
                 test_agent.endpoint,
                 content="not json",
                 headers={"Content-Type": "application/json"},
@@ -390,7 +411,7 @@ async def run_selftest():
         # Test missing jsonrpc field
         try:
             payload = {"method": "parity_choose", "id": 1}
-            resp = httpx.post(test_agent.endpoint, json=payload, timeout=5)
+            resp = test_agent.client.post(test_agent.endpoint, json=payload, timeout=5)
             data = resp.json()
             passed = (
                 "error" in data and
@@ -8,6 +8,7 @@ Maintains in-memory state for:
 - Event history
 - Parity strategy
 """
+import functools
 import hashlib
 import logging
 import threading
@@ -71,6 +72,24 @@ class Statistics:
         return self.wins / self.games_played
 
 
+@dataclass(frozen=True)
+class StatisticsSnapshot:
+    """Read-only copy of agent statistics, safe to share between callers."""
+    
+    games_invited: int = 0
+    games_played: int = 0
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    
+    @property
+    def win_rate(self) -> float:
+        """Calculate win rate."""
+        if self.games_played == 0:
+            return 0.0
+        return self.wins / self.games_played
+
+
 class AgentState:
     """Thread-safe agent state.
     
@@ -93,8 +112,9 @@ class AgentState:
         self.choices: dict[str, ParityChoice] = {}
         self.results: dict[str, MatchResult] = {}
         
-        # Statistics
+        # Statistics (plus a cached snapshot, rebuilt after each change)
         self.stats = Statistics()
+        self._stats_snapshot: Optional[StatisticsSnapshot] = None
         
         # Event history (for debugging and learning)
         self.history: list[dict] = []
@@ -135,6 +155,7 @@ class AgentState:
             
             # Update stats
             self.stats.games_invited += 1
+            self._stats_snapshot = None
             
             # Add to history
             self.history.append({
@@ -220,6 +241,7 @@ class AgentState:
             
             # Update statistics
             self.stats.games_played += 1
+            self._stats_snapshot = None
             
             if winner == self.display_name:
                 self.stats.wins += 1
@@ -250,20 +272,25 @@ class AgentState:
             )
             return result
     
-    def get_stats(self) -> Statistics:
+    def get_stats(self) -> StatisticsSnapshot:
         """Get current statistics.
         
+        The snapshot is cached until the next invitation or result is
+        recorded; it is frozen, so sharing it between callers is safe.
+        
         Returns:
-            Statistics object (copy)
+            Immutable StatisticsSnapshot
         """
         with self._lock:
-            return Statistics(
-                games_invited=self.stats.games_invited,
-                games_played=self.stats.games_played,
-                wins=self.stats.wins,
-                losses=self.stats.losses,
-                draws=self.stats.draws
-            )
+            if self._stats_snapshot is None:
+                self._stats_snapshot = StatisticsSnapshot(
+                    games_invited=self.stats.games_invited,
+                    games_played=self.stats.games_played,
+                    wins=self.stats.wins,
+                    losses=self.stats.losses,
+                    draws=self.stats.draws
+                )
+            return self._stats_snapshot
     
     def get_history(self) -> list[dict]:
         """Get event history.
@@ -303,11 +330,13 @@ class AgentState:
             return choice
 
 
+@functools.lru_cache(maxsize=2048)
 def deterministic_parity_choice(game_id: Optional[str]) -> str:
     """Choose parity deterministically based on game_id.
     
     This ensures the same game_id always gets the same choice,
-    but different game_ids get varied choices.
+    but different game_ids get varied choices. The function is pure,
+    so results are memoized per game_id.
     
     Args:
         game_id: Game ID (or None)
@@ -5,20 +5,60 @@ Implements the three required JSON-RPC methods:
 2. parity_choose / choose_parity
 3. notify_match_result
 """
+import functools
 import logging
-from typing import Any, Callable
+from typing import Callable
 
-from shared.jsonrpc import JSONRPCError, invalid_params_error
+from shared.jsonrpc import (
+    JSONRPCError,
+    validate_request,
+    create_success_response,
+    create_error_response,
+    invalid_params_error,
+    method_not_found_error,
+    internal_error,
+)
 from agents.player.state import get_state
 
 logger = logging.getLogger(__name__)
 
+# Known params per handler; anything else is recorded as extra fields
+_INVITATION_FIELDS = frozenset({"game_id", "invitation_id", "from_player"})
+_CHOICE_FIELDS = frozenset({"game_id"})
+_RESULT_FIELDS = frozenset({"game_id", "winner", "details"})
 
-def handle_game_invitation(params: dict | list | None) -> dict:
+
+def _requires_object_params(
+    handler: Callable[[dict], dict]
+) -> Callable[[dict | list | None], dict]:
+    """Wrap a handler whose params must be a JSON object.
+    
+    The wrapper validates params for direct callers. It also exposes the
+    original handler as ``unchecked``, so dispatch_method can do the same
+    check once itself and skip the extra call.
+    
+    Args:
+        handler: Handler that assumes params is a dict
+    
+    Returns:
+        Validating handler
+    """
+    @functools.wraps(handler)
+    def checked(params: dict | list | None) -> dict:
+        if not isinstance(params, dict):
+            raise invalid_params_error("params must be an object")
+        return handler(params)
+    
+    checked.unchecked = handler  # type: ignore[attr-defined]
+    return checked
+
+
+@_requires_object_params
+def handle_game_invitation(params: dict) -> dict:
     """Handle game invitation and return GAME_JOIN_ACK.
     
     Args:
-        params: Invitation parameters (expected to be a dict)
+        params: Invitation parameters
     
     Returns:
         GAME_JOIN_ACK response
@@ -26,54 +66,58 @@ def handle_game_invitation(params: dict | list | None) -> dict:
     Raises:
         JSONRPCError: If params are invalid
     """
-    # Validate params
-    if params is None or not isinstance(params, dict):
-        raise invalid_params_error("params must be an object")
-    
     # Extract known fields
     game_id = params.get("game_id")
     invitation_id = params.get("invitation_id")
     from_player = params.get("from_player")
     
-    # Extract extra fields (for debugging)
-    known_fields = {"game_id", "invitation_id", "from_player"}
-    extra_fields = {k: v for k, v in params.items() if k not in known_fields}
+    # Extract extra fields (for debugging); usually there are none
+    if params.keys() <= _INVITATION_FIELDS:
+        extra_fields = {}
+    else:
+        extra_fields = {k: v for k, v in params.items() if k not in _INVITATION_FIELDS}
     
     logger.info(
-        f"Received game invitation: game_id={game_id}, "
-        f"invitation_id={invitation_id}, from={from_player}"
+        "Received game invitation: game_id=%s, invitation_id=%s, from=%s",
+        game_id, invitation_id, from_player,
     )
     
     if extra_fields:
-        logger.debug(f"Extra fields in invitation: {extra_fields}")
+        logger.debug("Extra fields in invitation: %s", extra_fields)
     
     # Record in state
     state = get_state()
     state.record_invitation(game_id, invitation_id, from_player, extra_fields)
     
-    # Return GAME_JOIN_ACK
-    response = {
-        "type": "GAME_JOIN_ACK",
-        "accepted": True,
-    }
-    
-    # Include game_id if provided
-    if game_id:
-        response["game_id"] = game_id
-    
-    # Include invitation_id if provided
-    if invitation_id:
-        response["invitation_id"] = invitation_id
-    
-    logger.info(f"Accepting game invitation: {response}")
+    # Return GAME_JOIN_ACK, echoing game_id/invitation_id if provided.
+    # Referees send both, so build that case in a single literal.
+    if game_id and invitation_id:
+        response = {
+            "type": "GAME_JOIN_ACK",
+            "accepted": True,
+            "game_id": game_id,
+            "invitation_id": invitation_id,
+        }
+    else:
+        response = {
+            "type": "GAME_JOIN_ACK",
+            "accepted": True,
+        }
+        if game_id:
+            response["game_id"] = game_id
+        if invitation_id:
+            response["invitation_id"] = invitation_id
+    
+    logger.info("Accepting game invitation: %s", response)
     return response
 
 
-def parity_choose(params: dict | list | None) -> dict:
+@_requires_object_params
+def parity_choose(params: dict) -> dict:
     """Handle parity choice and return RESPONSE_PARITY_CHOOSE.
     
     Args:
-        params: Choice parameters (expected to be a dict)
+        params: Choice parameters
     
     Returns:
         RESPONSE_PARITY_CHOOSE response
@@ -81,20 +125,18 @@ def parity_choose(params: dict | list | None) -> dict:
     Raises:
         JSONRPCError: If params are invalid
     """
-    # Validate params
-    if params is None or not isinstance(params, dict):
-        raise invalid_params_error("params must be an object")
-    
     game_id = params.get("game_id")
     
     # Extract extra fields
-    known_fields = {"game_id"}
-    extra_fields = {k: v for k, v in params.items() if k not in known_fields}
+    if params.keys() <= _CHOICE_FIELDS:
+        extra_fields = {}
+    else:
+        extra_fields = {k: v for k, v in params.items() if k not in _CHOICE_FIELDS}
     
-    logger.info(f"Parity choice requested for game_id={game_id}")
+    logger.info("Parity choice requested for game_id=%s", game_id)
     
     if extra_fields:
-        logger.debug(f"Extra fields in parity_choose: {extra_fields}")
+        logger.debug("Extra fields in parity_choose: %s", extra_fields)
     
     # Use state's strategy-based choice method
     state = get_state()
@@ -103,24 +145,29 @@ def parity_choose(params: dict | list | None) -> dict:
     # Record in state
     state.record_choice(game_id, choice, extra_fields)
     
-    response = {
-        "type": "RESPONSE_PARITY_CHOOSE",
-        "choice": choice,
-    }
-    
     # Include game_id if provided
     if game_id:
-        response["game_id"] = game_id
-    
-    logger.info(f"Parity choice: {choice} for game_id={game_id}")
+        response = {
+            "type": "RESPONSE_PARITY_CHOOSE",
+            "choice": choice,
+            "game_id": game_id,
+        }
+    else:
+        response = {
+            "type": "RESPONSE_PARITY_CHOOSE",
+            "choice": choice,
+        }
+    
+    logger.info("Parity choice: %s for game_id=%s", choice, game_id)
     return response
 
 
-def notify_match_result(params: dict | list | None) -> dict:
+@_requires_object_params
+def notify_match_result(params: dict) -> dict:
     """Handle match result notification and acknowledge.
     
     Args:
-        params: Result parameters (expected to be a dict)
+        params: Result parameters
     
     Returns:
         Acknowledgment response
@@ -128,39 +175,37 @@ def notify_match_result(params: dict | list | None) -> dict:
     Raises:
         JSONRPCError: If params are invalid
     """
-    # Validate params
-    if params is None or not isinstance(params, dict):
-        raise invalid_params_error("params must be an object")
-    
     game_id = params.get("game_id")
     winner = params.get("winner")
     details = params.get("details", {})
     
     # Extract extra fields
-    known_fields = {"game_id", "winner", "details"}
-    extra_fields = {k: v for k, v in params.items() if k not in known_fields}
+    if params.keys() <= _RESULT_FIELDS:
+        extra_fields = {}
+    else:
+        extra_fields = {k: v for k, v in params.items() if k not in _RESULT_FIELDS}
     
-    logger.info(f"Match result: game_id={game_id}, winner={winner}, details={details}")
+    logger.info("Match result: game_id=%s, winner=%s, details=%s", game_id, winner, details)
     
     if extra_fields:
-        logger.debug(f"Extra fields in match result: {extra_fields}")
+        logger.debug("Extra fields in match result: %s", extra_fields)
     
     # Record in state
     state = get_state()
     state.record_result(game_id, winner, details, extra_fields)
     
     # Log updated statistics
-    stats = state.get_stats()
-    logger.info(
-        f"Updated stats: games={stats.games_played}, "
-        f"W={stats.wins}, L={stats.losses}, D={stats.draws}, "
-        f"win_rate={stats.win_rate:.2%}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        stats = state.get_stats()
+        logger.info(
+            "Updated stats: games=%d, W=%d, L=%d, D=%d, win_rate=%.2f%%",
+            stats.games_played, stats.wins, stats.losses, stats.draws, stats.win_rate * 100,
+        )
     
     # Return acknowledgment
     response = {"ok": True}
     
-    logger.info(f"Match result acknowledged for game_id={game_id}")
+    logger.info("Match result acknowledged for game_id=%s", game_id)
     return response
 
 
@@ -186,6 +231,9 @@ METHOD_REGISTRY: dict[str, Callable[[dict | list | None], dict]] = {
     "ping": ping,  # Connectivity check
 }
 
+# Supported method names, in registry order
+_SUPPORTED_METHODS: tuple[str, ...] = tuple(METHOD_REGISTRY)
+
 
 def dispatch_method(method: str, params: dict | list | None) -> dict:
     """Dispatch method call to appropriate handler.
@@ -199,23 +247,76 @@ def dispatch_method(method: str, params: dict | list | None) -> dict:
     
     Raises:
         KeyError: If method not found in registry
-        JSONRPCError: If handler raises validation error
+        JSONRPCError: If params are invalid or handler raises validation error
     """
-    if method not in METHOD_REGISTRY:
+    # Look up the live registry so dispatch always agrees with callers that
+    # check membership in METHOD_REGISTRY
+    handler = METHOD_REGISTRY.get(method)
+    if handler is None:
         raise KeyError(f"Method '{method}' not found")
     
-    handler = METHOD_REGISTRY[method]
+    # Handlers marked by _requires_object_params: validate params once,
+    # here, and call the original handler directly
+    unchecked = getattr(handler, "unchecked", None)
+    if unchecked is not None:
+        if not isinstance(params, dict):
+            raise invalid_params_error("params must be an object")
+        return unchecked(params)
     
     # Call handler
-    result = handler(params)
+    return handler(params)
+
+
+def dispatch_batch(requests: list) -> list[dict]:
+    """Dispatch a JSON-RPC 2.0 batch.
     
-    return result
+    Entries are processed in order. Each failing entry gets its own error
+    object instead of failing the whole batch, and notifications produce
+    no response entry.
+    
+    Args:
+        requests: Decoded batch array (non-empty)
+    
+    Returns:
+        Response objects for the non-notification entries
+    """
+    responses = []
+    for item in requests:
+        request, error = validate_request(item)
+        if request is None:
+            # Invalid entries are answered with a null id, per the spec
+            responses.append(create_error_response(None, error))
+            continue
+        
+        # Unknown methods are answered directly, as mcp_endpoint does, so a
+        # KeyError raised inside a handler is reported as an internal error
+        if request.method not in METHOD_REGISTRY:
+            error = method_not_found_error(request.method)
+        else:
+            try:
+                result = dispatch_method(request.method, request.params)
+            except JSONRPCError as e:
+                error = e
+            except Exception as e:
+                logger.error(
+                    "Unexpected error in batch entry '%s': %s", request.method, e, exc_info=True
+                )
+                error = internal_error(e)
+        
+        if request.is_notification:
+            continue
+        if error is None:
+            responses.append(create_success_response(request.id, result))
+        else:
+            responses.append(create_error_response(request.id, error))
+    
+    return responses
 
 
-def get_supported_methods() -> list[str]:
-    """Get list of supported method names.
+def get_supported_methods() -> tuple[str, ...]:
+    """Get supported method names.
     
     Returns:
-        List of method names
+        Tuple of method names (computed once; the registry is fixed at import)
     """
-    return list(METHOD_REGISTRY.keys())
+    return _SUPPORTED_METHODS
@@ -252,4 +252,7 @@ class RefereeServer:
         logger.info(f"Referee MCP Server starting on http://{self.host}:{self.port}")
         logger.info(f"MCP endpoint: http://{self.host}:{self.port}/mcp")
         
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            await self.referee.aclose()
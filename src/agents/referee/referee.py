@@ -49,13 +49,29 @@ class GameResult:
 class Referee:
     """Runs parity games between agents."""
     
-    def __init__(self, timeout: float = 5.0):
+    def __init__(self, timeout: float = 5.0, client: Optional[httpx.AsyncClient] = None):
         """Initialize referee.
         
         Args:
             timeout: Timeout for agent communication in seconds
+            client: Shared HTTP client for player calls; if omitted, the referee
+                creates one on first use and keeps it for later games
         """
         self.timeout = timeout
+        self._client = client
+        self._owns_client = client is None
+    
+    async def _post(self, endpoint: str, payload: dict) -> httpx.Response:
+        """POST a JSON-RPC payload to a player over the pooled client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+        return await self._client.post(endpoint, json=payload, timeout=self.timeout)
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client if the referee created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def run_game(self, player1: Agent, player2: Agent) -> GameResult:
         """Run a single parity game between two players.
@@ -176,27 +192,22 @@ class Referee:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    player.endpoint,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                if "error" in data:
-                    logger.error(f"Invitation error from {player.display_name}: {data['error']}")
-                    return False
-                
-                result = data.get("result", {})
-                if result.get("type") == "GAME_JOIN_ACK" and result.get("accepted"):
-                    logger.debug(f"Invitation accepted by {player.display_name}")
-                    return True
-                else:
-                    logger.warning(f"Invitation not accepted by {player.display_name}: {result}")
-                    return False
-                    
+            response = await self._post(player.endpoint, payload)
+            response.raise_for_status()
+            data = response.json()
+            
+            if "error" in data:
+                logger.error(f"Invitation error from {player.display_name}: {data['error']}")
+                return False
+            
+            result = data.get("result", {})
+            if result.get("type") == "GAME_JOIN_ACK" and result.get("accepted"):
+                logger.debug(f"Invitation accepted by {player.display_name}")
+                return True
+            else:
+                logger.warning(f"Invitation not accepted by {player.display_name}: {result}")
+                return False
+            
         except Exception as e:
             logger.error(f"Error sending invitation to {player.display_name}: {e}")
             return False
@@ -221,28 +232,23 @@ class Referee:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    player.endpoint,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                if "error" in data:
-                    logger.error(f"Parity choice error from {player.display_name}: {data['error']}")
-                    return None
-                
-                result = data.get("result", {})
-                choice = result.get("choice")
-                
-                if choice in ("even", "odd"):
-                    return choice
-                else:
-                    logger.warning(f"Invalid choice from {player.display_name}: {choice}")
-                    return None
-                    
+            response = await self._post(player.endpoint, payload)
+            response.raise_for_status()
+            data = response.json()
+            
+            if "error" in data:
+                logger.error(f"Parity choice error from {player.display_name}: {data['error']}")
+                return None
+            
+            result = data.get("result", {})
+            choice = result.get("choice")
+            
+            if choice in ("even", "odd"):
+                return choice
+            else:
+                logger.warning(f"Invalid choice from {player.display_name}: {choice}")
+                return None
+            
         except Exception as e:
             logger.error(f"Error getting parity choice from {player.display_name}: {e}")
             return None
@@ -277,27 +283,22 @@ class Referee:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    player.endpoint,
-                    json=payload,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                if "error" in data:
-                    logger.warning(f"Result notification error from {player.display_name}: {data['error']}")
-                    return False
-                
-                result_data = data.get("result", {})
-                if result_data.get("ok"):
-                    logger.debug(f"Result acknowledged by {player.display_name}")
-                    return True
-                else:
-                    logger.warning(f"Result not acknowledged by {player.display_name}")
-                    return False
-                    
+            response = await self._post(player.endpoint, payload)
+            response.raise_for_status()
+            data = response.json()
+            
+            if "error" in data:
+                logger.warning(f"Result notification error from {player.display_name}: {data['error']}")
+                return False
+            
+            result_data = data.get("result", {})
+            if result_data.get("ok"):
+                logger.debug(f"Result acknowledged by {player.display_name}")
+                return True
+            else:
+                logger.warning(f"Result not acknowledged by {player.display_name}")
+                return False
+            
         except Exception as e:
             logger.error(f"Error notifying {player.display_name}: {e}")
             return False
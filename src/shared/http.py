@@ -1 +1,31 @@
-# HTTP client helpers, timeouts, retries
\ No newline at end of file
+"""HTTP helpers shared by the agent servers."""
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to compact JSON bytes, preferring orjson."""
+    if orjson is None:
+        text = json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":"))
+        return text.encode("utf-8")
+    return orjson.dumps(content)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized directly to bytes with orjson.
+    
+    Falls back to stdlib json when orjson is unavailable.
+    """
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        return dumps(content)
@@ -5,11 +5,20 @@ according to JSON-RPC 2.0 specification.
 
 Specification: https://www.jsonrpc.org/specification
 """
-import json
 import logging
 from typing import Any, Optional
 from dataclasses import dataclass
 
+try:
+    import orjson as _json
+
+    _dumps = _json.dumps
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    import json as _json  # type: ignore[no-redef]
+
+    def _dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        return _json.dumps(obj, separators=(",", ":")).encode()
+
 logger = logging.getLogger(__name__)
 
 # JSON-RPC 2.0 Error Codes
@@ -20,7 +29,7 @@ INVALID_PARAMS = -32602
 INTERNAL_ERROR = -32603
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONRPCRequest:
     """Validated JSON-RPC request."""
     
@@ -35,7 +44,7 @@ class JSONRPCRequest:
         return self.id is None
 
 
-@dataclass
+@dataclass(slots=True)
 class JSONRPCError(Exception):
     """JSON-RPC error details."""
     
@@ -50,100 +59,126 @@ class JSONRPCError(Exception):
         return f"JSONRPCError({self.code}): {self.message}"
 
 
-def parse_request(body: bytes) -> tuple[Optional[JSONRPCRequest], Optional[JSONRPCError]]:
-    """Parse and validate JSON-RPC request.
+# Members every request object must carry
+_REQUIRED_FIELDS = frozenset({"jsonrpc", "method"})
+
+# Accepted types for the optional "params" and "id" members
+_PARAMS_TYPES = (dict, list)
+_ID_TYPES = (int, str, type(None))
+
+# Fixed-message "Invalid Request" errors, shared so the rejection path does
+# not allocate. These are returned by validate_request, never raised.
+_ERR_NOT_OBJECT = JSONRPCError(INVALID_REQUEST, "Invalid Request", "Request must be a JSON object")
+_ERR_MISSING_JSONRPC = JSONRPCError(INVALID_REQUEST, "Invalid Request", "Missing 'jsonrpc' field")
+_ERR_BAD_JSONRPC = JSONRPCError(INVALID_REQUEST, "Invalid Request", "'jsonrpc' must be '2.0'")
+_ERR_MISSING_METHOD = JSONRPCError(INVALID_REQUEST, "Invalid Request", "Missing 'method' field")
+_ERR_BAD_METHOD = JSONRPCError(INVALID_REQUEST, "Invalid Request", "'method' must be a string")
+_ERR_BAD_PARAMS = JSONRPCError(
+    INVALID_REQUEST, "Invalid Request", "'params' must be an object or array"
+)
+_ERR_BAD_ID = JSONRPCError(
+    INVALID_REQUEST, "Invalid Request", "'id' must be a string, number, or null"
+)
+
+
+def decode_message(body: bytes) -> tuple[Any, Optional[JSONRPCError]]:
+    """Decode a raw JSON-RPC message body.
     
     Args:
         body: Raw request body
     
     Returns:
-        Tuple of (request, error). One will be None.
-        - If valid: (JSONRPCRequest, None)
-        - If invalid: (None, JSONRPCError)
+        Tuple of (data, error). error is None if the body is valid JSON;
+        data may be a request object or a batch array.
     """
-    # Step 1: Parse JSON
     try:
-        data = json.loads(body)
-    except json.JSONDecodeError as e:
-        logger.warning(f"JSON parse error: {e}")
+        return _json.loads(body), None
+    except _json.JSONDecodeError as e:
+        logger.warning("JSON parse error: %s", e)
         return None, JSONRPCError(
             code=PARSE_ERROR,
             message="Parse error",
             data=str(e)
         )
+
+
+def parse_request(body: bytes) -> tuple[Optional[JSONRPCRequest], Optional[JSONRPCError]]:
+    """Parse and validate JSON-RPC request.
     
-    # Step 2: Validate structure (must be object)
-    if not isinstance(data, dict):
-        logger.warning(f"Invalid request: not an object, got {type(data)}")
-        return None, JSONRPCError(
-            code=INVALID_REQUEST,
-            message="Invalid Request",
-            data="Request must be a JSON object"
-        )
+    Args:
+        body: Raw request body
     
-    # Step 3: Validate jsonrpc field
-    if "jsonrpc" not in data:
-        logger.warning("Invalid request: missing 'jsonrpc' field")
-        return None, JSONRPCError(
-            code=INVALID_REQUEST,
-            message="Invalid Request",
-            data="Missing 'jsonrpc' field"
-        )
+    Returns:
+        Tuple of (request, error). One will be None.
+        - If valid: (JSONRPCRequest, None)
+        - If invalid: (None, JSONRPCError)
+    """
+    # Parse JSON, then validate the request object
+    data, error = decode_message(body)
+    if error is not None:
+        return None, error
     
-    if data["jsonrpc"] != "2.0":
-        logger.warning(f"Invalid request: jsonrpc = {data['jsonrpc']}, expected '2.0'")
-        return None, JSONRPCError(
-            code=INVALID_REQUEST,
-            message="Invalid Request",
-            data="'jsonrpc' must be '2.0'"
-        )
+    return validate_request(data)
+
+
+def validate_request(data: Any) -> tuple[Optional[JSONRPCRequest], Optional[JSONRPCError]]:
+    """Validate a decoded JSON-RPC request object.
     
-    # Step 4: Validate method field
-    if "method" not in data:
+    Args:
+        data: Decoded JSON value (a single request, e.g. one batch entry)
+    
+    Returns:
+        Tuple of (request, error). One will be None.
+    """
+    # Step 1: Validate structure (must be object)
+    if not isinstance(data, dict):
+        logger.warning("Invalid request: not an object, got %s", type(data))
+        return None, _ERR_NOT_OBJECT
+    
+    # Step 2: Check required fields are present (one set difference)
+    missing = _REQUIRED_FIELDS.difference(data)
+    if missing:
+        if "jsonrpc" in missing:
+            logger.warning("Invalid request: missing 'jsonrpc' field")
+            return None, _ERR_MISSING_JSONRPC
         logger.warning("Invalid request: missing 'method' field")
-        return None, JSONRPCError(
-            code=INVALID_REQUEST,
-            message="Invalid Request",
-            data="Missing 'method' field"
-        )
+        return None, _ERR_MISSING_METHOD
     
-    if not isinstance(data["method"], str):
-        logger.warning(f"Invalid request: method not a string, got {type(data['method'])}")
-        return None, JSONRPCError(
-            code=INVALID_REQUEST,
-            message="Invalid Request",
-            data="'method' must be a string"
-        )
+    # Step 3: Validate jsonrpc and method values
+    jsonrpc = data["jsonrpc"]
+    if jsonrpc != "2.0":
+        logger.warning("Invalid request: jsonrpc = %s, expected '2.0'", jsonrpc)
+        return None, _ERR_BAD_JSONRPC
     
-    # Step 5: Validate params (optional, but if present must be object or array)
+    method = data["method"]
+    if not isinstance(method, str):
+        logger.warning("Invalid request: method not a string, got %s", type(method))
+        return None, _ERR_BAD_METHOD
+    
+    # Step 4: Validate params (optional, but if present must be object or array)
     params = data.get("params")
-    if params is not None and not isinstance(params, (dict, list)):
-        logger.warning(f"Invalid request: params must be object or array, got {type(params)}")
-        return None, JSONRPCError(
-            code=INVALID_REQUEST,
-            message="Invalid Request",
-            data="'params' must be an object or array"
-        )
+    if params is not None and not isinstance(params, _PARAMS_TYPES):
+        logger.warning("Invalid request: params must be object or array, got %s", type(params))
+        return None, _ERR_BAD_PARAMS
     
-    # Step 6: Extract id (optional, can be string, number, or null)
+    # Step 5: Extract id (optional, can be string, number, or null)
     request_id = data.get("id")
-    if request_id is not None and not isinstance(request_id, (int, str, type(None))):
-        logger.warning(f"Invalid request: id must be string, number, or null, got {type(request_id)}")
-        return None, JSONRPCError(
-            code=INVALID_REQUEST,
-            message="Invalid Request",
-            data="'id' must be a string, number, or null"
+    if not isinstance(request_id, _ID_TYPES):
+        logger.warning(
+            "Invalid request: id must be string, number, or null, got %s", type(request_id)
         )
+        return None, _ERR_BAD_ID
     
     # Valid request
     request = JSONRPCRequest(
-        jsonrpc=data["jsonrpc"],
-        method=data["method"],
+        jsonrpc=jsonrpc,
+        method=method,
         params=params,
         id=request_id
     )
     
-    logger.debug(f"Parsed valid JSON-RPC request: method={request.method}, id={request.id}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Parsed valid JSON-RPC request: method=%s, id=%s", request.method, request.id)
     return request, None
 
 
@@ -164,6 +199,27 @@ def create_success_response(request_id: int | str | None, result: Any) -> dict:
     }
 
 
+# Fixed parts of the success envelope, pre-encoded for encode_success_response
+_SUCCESS_PREFIX = b'{"jsonrpc":"2.0","id":'
+_SUCCESS_RESULT = b',"result":'
+
+
+def encode_success_response(request_id: int | str | None, result: Any) -> bytes:
+    """Encode a JSON-RPC success response straight to JSON bytes.
+    
+    Equivalent to serializing create_success_response(), without building
+    the intermediate envelope dict.
+    
+    Args:
+        request_id: Request ID from original request
+        result: Result data (any JSON-serializable value)
+    
+    Returns:
+        UTF-8 JSON bytes
+    """
+    return _SUCCESS_PREFIX + _dumps(request_id) + _SUCCESS_RESULT + _dumps(result) + b"}"
+
+
 def create_error_response(
     request_id: int | str | None,
     error: JSONRPCError
@@ -177,19 +233,15 @@ def create_error_response(
     Returns:
         JSON-RPC error response dict
     """
-    response = {
+    error_obj = {"code": error.code, "message": error.message}
+    if error.data is not None:
+        error_obj["data"] = error.data
+    
+    return {
         "jsonrpc": "2.0",
         "id": request_id,
-        "error": {
-            "code": error.code,
-            "message": error.message
-        }
+        "error": error_obj
     }
-    
-    if error.data is not None:
-        response["error"]["data"] = error.data
-    
-    return response
 
 
 def parse_error(exception: Exception) -> JSONRPCError:
@@ -1 +1,11 @@
-# dataclasses / pydantic models for messages
\ No newline at end of file
+"""Message models shared by the league services."""
+from pydantic import BaseModel
+
+
+class RegisterRequest(BaseModel):
+    """Body of a registration sent to the League Manager."""
+    
+    display_name: str
+    version: str | int | float  # some agents send a bare number
+    endpoint: str
+    agent_type: str = "player"  # "player" or "referee"
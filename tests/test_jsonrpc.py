@@ -4,6 +4,7 @@ import pytest
 from shared.jsonrpc import (
     parse_request,
     create_success_response,
+    encode_success_response,
     create_error_response,
     JSONRPCError,
     parse_error,
@@ -158,6 +159,15 @@ class TestCreateResponses:
         assert response["result"] == result
         assert "error" not in response
     
+    def test_encode_success_response_matches_dict(self):
+        """Test encoded success response decodes to the dict envelope."""
+        result = {"type": "RESPONSE_PARITY_CHOOSE", "choice": "even"}
+        for request_id in (1, "abc", None):
+            body = encode_success_response(request_id, result)
+            
+            assert isinstance(body, bytes)
+            assert json.loads(body) == create_success_response(request_id, result)
+    
     def test_create_error_response(self):
         """Test creating error response."""
         error = JSONRPCError(code=-32600, message="Invalid Request")
@@ -0,0 +1,272 @@
+"""Tests for League Manager endpoints and bookkeeping."""
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from agents.league_manager.manager import LeagueManager, Standing, _round_robin_schedule
+from agents.referee.referee import Agent, GameResult
+
+
+def make_result(player1: str, player2: str, winner: str | None) -> GameResult:
+    """Build a finished game result between two players."""
+    return GameResult(
+        game_id="game_test",
+        player1=player1,
+        player2=player2,
+        player1_choice="even",
+        player2_choice="odd",
+        dice_roll=2,
+        dice_parity="even",
+        winner=winner
+    )
+
+
+@pytest.mark.parametrize("count", [2, 5, 6])
+def test_round_robin_schedule_pairs_everyone_once(count):
+    """Test every pair meets once and no agent plays twice in a slot."""
+    agents = [Agent(display_name=f"A{i}", version="1.0.0", endpoint="") for i in range(count)]
+    schedule = _round_robin_schedule(agents)
+    
+    pairs = [frozenset((a.display_name, b.display_name)) for slot in schedule for a, b in slot]
+    assert len(pairs) == len(set(pairs)) == count * (count - 1) // 2
+    for slot in schedule:
+        names = [agent.display_name for pair in slot for agent in pair]
+        assert len(names) == len(set(names))
+
+
+@pytest_asyncio.fixture
+async def empty_manager():
+    """League manager with no players; its HTTP client is closed afterwards."""
+    lm = LeagueManager(port=0, rounds=1, use_external_referee=True)
+    yield lm
+    await lm.stop_server()
+
+
+@pytest.fixture
+def manager(empty_manager):
+    """League manager with two players in the standings."""
+    empty_manager.stats.standings["Alpha"] = Standing()
+    empty_manager.stats.standings["Beta"] = Standing()
+    return empty_manager
+
+
+def make_client(manager: LeagueManager) -> httpx.AsyncClient:
+    """HTTP client bound to the manager's ASGI app."""
+    transport = httpx.ASGITransport(app=manager.app)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+async def register(client: httpx.AsyncClient, name: str) -> httpx.Response:
+    """Register a player called `name` through the /register endpoint."""
+    return await client.post("/register", json={
+        "display_name": name,
+        "version": "1.0.0",
+        "endpoint": f"http://127.0.0.1:0/{name}"
+    })
+
+
+@pytest.mark.asyncio
+async def test_wait_complete_returns_when_games_recorded(manager):
+    """Test /wait-complete blocks until the expected games are played."""
+    async with make_client(manager) as client:
+        waiter = asyncio.create_task(
+            client.get("/wait-complete", params={"expected": 2, "timeout": 5})
+        )
+        
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        
+        manager._record_result(make_result("Alpha", "Beta", "Alpha"))
+        manager._notify_game_recorded()
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        
+        manager._record_result(make_result("Alpha", "Beta", None))
+        manager._notify_game_recorded()
+        response = await asyncio.wait_for(waiter, timeout=2)
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["complete"] is True
+    assert data["total_games"] == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_complete_times_out(manager):
+    """Test /wait-complete reports incomplete on timeout."""
+    async with make_client(manager) as client:
+        response = await client.get("/wait-complete", params={"expected": 1, "timeout": 0.05})
+    
+    assert response.status_code == 200
+    assert response.json()["complete"] is False
+
+
+def test_record_result_updates_points_and_win_rate(manager):
+    """Test cached points and win rate follow the recorded results."""
+    manager._record_result(make_result("Alpha", "Beta", "Alpha"))
+    manager._record_result(make_result("Alpha", "Beta", None))
+    
+    alpha = manager.stats.standings["Alpha"]
+    beta = manager.stats.standings["Beta"]
+    assert (alpha.points, alpha.win_rate) == (4, 0.5)
+    assert (beta.points, beta.win_rate) == (1, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_standings_cached_until_result_recorded(manager):
+    """Test /standings reuses its body until a result changes the table."""
+    async with make_client(manager) as client:
+        first = (await client.get("/standings")).json()
+        assert manager._standings_response() is manager._standings_response()
+        
+        manager._record_result(make_result("Alpha", "Beta", "Beta"))
+        second = (await client.get("/standings")).json()
+    
+    assert first["total_games"] == 0
+    assert second["total_games"] == 1
+    assert [row["agent"] for row in second["standings"]] == ["Beta", "Alpha"]
+    assert second["standings"][0]["points"] == 3
+
+
+@pytest.mark.asyncio
+async def test_agents_listing_refreshed_on_registration(empty_manager):
+    """Test the cached /agents body picks up newly registered players."""
+    async with make_client(empty_manager) as client:
+        assert (await client.get("/agents")).json() == {"agents": []}
+        await register(client, "Alpha")
+        response = await client.get("/agents")
+    
+    assert [a["display_name"] for a in response.json()["agents"]] == ["Alpha"]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_agents_returns_after_registration(empty_manager):
+    """Test /wait-for-agents blocks until enough players register."""
+    async with make_client(empty_manager) as client:
+        waiter = asyncio.create_task(
+            client.get("/wait-for-agents", params={"count": 2, "timeout": 5})
+        )
+        
+        for name in ("Alpha", "Beta"):
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            response = await register(client, name)
+            assert response.status_code == 200
+        
+        response = await asyncio.wait_for(waiter, timeout=2)
+    
+    assert response.json() == {"ready": True, "registered_agents": 2}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_agent_by_name(empty_manager):
+    """Test wait_for_agent returns once that specific player registers."""
+    async with make_client(empty_manager) as client:
+        waiter = asyncio.create_task(empty_manager.wait_for_agent("Beta", timeout=5))
+        
+        for name in ("Alpha", "Beta"):
+            await asyncio.sleep(0.05)
+            assert not waiter.done()
+            await register(client, name)
+        
+        assert await asyncio.wait_for(waiter, timeout=2) is True
+    
+    assert await empty_manager.wait_for_agent("Gamma", timeout=0.05) is False
+
+
+@pytest.mark.asyncio
+async def test_run_league_plays_round_games_concurrently():
+    """Test disjoint games run in parallel, bounded by max_parallel_games."""
+    manager = LeagueManager(port=0, rounds=2, max_parallel_games=3)
+    busy: set[str] = set()
+    peak = 0
+    
+    async def run_game(player1, player2):
+        nonlocal peak
+        names = {player1.display_name, player2.display_name}
+        assert not busy & names
+        busy.update(names)
+        peak = max(peak, len(busy) // 2)
+        await asyncio.sleep(0.01)
+        busy.difference_update(names)
+        return make_result(player1.display_name, player2.display_name, player1.display_name)
+    
+    manager.referee.run_game = run_game
+    for i in range(8):
+        name = f"Agent{i}"
+        manager.agents[name] = Agent(display_name=name, version="1.0.0", endpoint="")
+        manager.stats.standings[name] = Standing()
+    
+    final = await manager.run_league()
+    await manager.stop_server()
+    
+    assert peak == 3
+    assert final["total_games"] == 56
+    assert manager.stats.total_rounds_completed == 2
+    assert len(manager.stats.game_history) == 56
+
+
+@pytest.mark.asyncio
+async def test_run_league_starts_as_soon_as_agents_register():
+    """Test run_league wakes on registration instead of polling."""
+    manager = LeagueManager(port=0, rounds=1)
+    
+    async def run_game(player1, player2):
+        return make_result(player1.display_name, player2.display_name, None)
+    
+    manager.referee.run_game = run_game
+    league = asyncio.create_task(manager.run_league(wait_for_agents=2, wait_timeout=5))
+    
+    async with make_client(manager) as client:
+        for name in ("Alpha", "Beta"):
+            await asyncio.sleep(0.05)
+            assert not league.done()
+            await register(client, name)
+    
+    final = await asyncio.wait_for(league, timeout=0.5)
+    await manager.stop_server()
+    assert final["total_games"] == 1
+
+
+@pytest.mark.asyncio
+async def test_register_rejects_incomplete_body(empty_manager):
+    """Test /register reports missing fields and bad JSON as 400 errors."""
+    async with make_client(empty_manager) as client:
+        missing = await client.post("/register", json={"display_name": "Alpha"})
+        invalid = await client.post(
+            "/register", content=b"{not json", headers={"content-type": "application/json"}
+        )
+    
+    assert missing.status_code == 400
+    assert missing.json() == {"error": "Missing required fields: ['version', 'endpoint']"}
+    assert invalid.status_code == 400
+    assert invalid.json() == {"error": "Invalid JSON"}
+    assert empty_manager.agents == {}
+
+
+@pytest.mark.asyncio
+async def test_register_accepts_numeric_version(empty_manager):
+    """Test a numeric version is accepted and kept as sent."""
+    async with make_client(empty_manager) as client:
+        response = await client.post("/register", json={
+            "display_name": "Alpha",
+            "version": 2,
+            "endpoint": "http://127.0.0.1:0/Alpha"
+        })
+    
+    assert response.status_code == 200
+    assert empty_manager.agents["Alpha"].version == 2
+
+
+@pytest.mark.asyncio
+async def test_bad_query_param_keeps_default_422(empty_manager):
+    """Test only /register maps validation errors to 400."""
+    async with make_client(empty_manager) as client:
+        missing = await client.get("/wait-for-agents")
+        invalid = await client.get("/wait-complete", params={"expected": "many"})
+    
+    assert missing.status_code == 422
+    assert missing.json()["detail"][0]["loc"] == ["query", "count"]
+    assert invalid.status_code == 422
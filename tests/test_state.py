@@ -1,4 +1,5 @@
 """Unit tests for state management."""
+import dataclasses
 import pytest
 import threading
 import time
@@ -287,3 +288,24 @@ class TestStatistics:
         stats = fresh_state.get_stats()
         assert stats.games_played == 0
         assert stats.win_rate == 0.0
+    
+    def test_stats_snapshot_refreshed_after_changes(self, fresh_state):
+        """Test cached stats are invalidated by new invitations and results."""
+        before = fresh_state.get_stats()
+        assert fresh_state.get_stats() is before
+        
+        fresh_state.record_invitation("game1", "inv1", "Referee", {})
+        assert fresh_state.get_stats().games_invited == 1
+        
+        fresh_state.record_result("game1", "TestAgent", {}, {})
+        stats = fresh_state.get_stats()
+        assert stats.games_played == 1
+        assert stats.wins == 1
+        assert before.games_played == 0
+    
+    def test_stats_snapshot_is_read_only(self, fresh_state):
+        """Test the shared stats snapshot cannot be mutated by a caller."""
+        stats = fresh_state.get_stats()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            stats.wins = 5
+        assert fresh_state.get_stats().wins == 0
@@ -5,10 +5,11 @@ Tests that state is properly initialized, thread-safe, and deterministic.
 This test requires a running agent server on port 8001.
 Run: python -m agent --port 8001 --display-name TestAgent
 """
+import asyncio
+import httpx
 import pytest
 import requests
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 def server_is_running():
@@ -176,21 +177,23 @@ def test_state_management():
     print("✓ Extra parameters handled gracefully")
     
     # Test 6: Concurrent requests (thread safety)
-    def make_choice(game_id):
-        resp = requests.post(
-            f"{base_url}/mcp",
-            json={
-                "jsonrpc": "2.0",
-                "id": hash(game_id) % 10000,
-                "method": "parity_choose",
-                "params": {"game_id": game_id}
-            }
-        )
-        return resp.json()
-    
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(make_choice, f"concurrent_{i}") for i in range(20)]
-        results = [f.result() for f in as_completed(futures)]
+    async def make_choices(game_ids):
+        async with httpx.AsyncClient(limits=httpx.Limits(max_connections=32)) as client:
+            responses = await asyncio.gather(*[
+                client.post(
+                    f"{base_url}/mcp",
+                    json={
+                        "jsonrpc": "2.0",
+                        "id": hash(game_id) % 10000,
+                        "method": "parity_choose",
+                        "params": {"game_id": game_id}
+                    }
+                )
+                for game_id in game_ids
+            ])
+        return [resp.json() for resp in responses]
+    
+    results = asyncio.run(make_choices([f"concurrent_{i}" for i in range(20)]))
     
     assert len(results) == 20
     assert all("result" in r for r in results)
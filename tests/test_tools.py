@@ -1,6 +1,15 @@
 """Unit tests for tool handlers."""
+import functools
+
 import pytest
-from agents.player.tools import handle_game_invitation, parity_choose, notify_match_result
+from agents.player.tools import (
+    METHOD_REGISTRY,
+    handle_game_invitation,
+    parity_choose,
+    notify_match_result,
+    dispatch_method,
+    dispatch_batch,
+)
 from shared.jsonrpc import JSONRPCError
 from agents.player.state import init_state, get_state
 
@@ -262,3 +271,103 @@ class TestNotifyMatchResult:
         state = get_state()
         assert "game888" in state.results
         assert state.results["game888"].extra_fields["extra_metadata"] == "should_be_stored"
+
+
+class TestDispatchMethod:
+    """Tests for dispatch_method."""
+    
+    def test_alternating_methods_reach_correct_handler(self):
+        """Test repeated and alternating calls dispatch to the right handler."""
+        assert dispatch_method("ping", None)["message"] == "pong"
+        assert dispatch_method("ping", {})["message"] == "pong"
+        
+        result = dispatch_method("parity_choose", {"game_id": "g1"})
+        assert result["type"] == "RESPONSE_PARITY_CHOOSE"
+        
+        result = dispatch_method("handle_game_invitation", {"game_id": "g1"})
+        assert result["type"] == "GAME_JOIN_ACK"
+        
+        assert dispatch_method("ping", None)["message"] == "pong"
+    
+    def test_unknown_method_raises_key_error(self):
+        """Test unknown methods raise KeyError after a cached dispatch."""
+        dispatch_method("ping", None)
+        
+        with pytest.raises(KeyError):
+            dispatch_method("no_such_method", None)
+        
+        assert dispatch_method("ping", None)["message"] == "pong"
+    
+    def test_non_object_params_rejected_for_guarded_methods(self):
+        """Test dispatch validates params once for object-param handlers."""
+        for method in ("handle_game_invitation", "parity_choose", "notify_match_result"):
+            with pytest.raises(JSONRPCError) as exc_info:
+                dispatch_method(method, ["game1"])
+            assert exc_info.value.code == -32602
+        
+        # ping accepts any params
+        assert dispatch_method("ping", ["anything"])["message"] == "pong"
+    
+    def test_dispatch_uses_live_registry(self, monkeypatch):
+        """Test methods registered after import are dispatched."""
+        monkeypatch.setitem(METHOD_REGISTRY, "echo", lambda params: {"echo": params})
+        
+        assert dispatch_method("echo", [1, 2]) == {"echo": [1, 2]}
+    
+    def test_other_wrapping_decorators_are_not_stripped(self, monkeypatch):
+        """Test only _requires_object_params handlers skip their wrapper."""
+        calls = []
+        
+        def traced(handler):
+            @functools.wraps(handler)
+            def wrapper(params):
+                calls.append(params)
+                return handler(params)
+            return wrapper
+        
+        monkeypatch.setitem(METHOD_REGISTRY, "traced_ping", traced(lambda params: {"ok": True}))
+        
+        assert dispatch_method("traced_ping", ["anything"]) == {"ok": True}
+        assert calls == [["anything"]]
+
+
+class TestDispatchBatch:
+    """Tests for dispatch_batch."""
+    
+    def test_batch_preserves_order_and_isolates_errors(self):
+        """Test each entry gets its own result or error, in request order."""
+        responses = dispatch_batch([
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+            {"jsonrpc": "2.0", "id": 2, "method": "no_such_method"},
+            {"jsonrpc": "2.0", "id": 3, "method": "parity_choose", "params": {"game_id": "g1"}},
+            {"jsonrpc": "2.0", "id": 4, "method": "parity_choose", "params": ["g1"]},
+            {"method": "ping"},
+        ])
+        
+        assert [r["id"] for r in responses] == [1, 2, 3, 4, None]
+        assert responses[0]["result"]["message"] == "pong"
+        assert responses[1]["error"]["code"] == -32601
+        assert responses[2]["result"]["type"] == "RESPONSE_PARITY_CHOOSE"
+        assert responses[3]["error"]["code"] == -32602
+        assert responses[4]["error"]["code"] == -32600
+    
+    def test_batch_notifications_get_no_response(self):
+        """Test notifications are processed but produce no response entry."""
+        responses = dispatch_batch([
+            {"jsonrpc": "2.0", "method": "notify_match_result",
+             "params": {"game_id": "g9", "winner": "TestAgent"}},
+            {"jsonrpc": "2.0", "method": "no_such_method"},
+        ])
+        
+        assert responses == []
+        assert "g9" in get_state().results
+    
+    def test_batch_handler_key_error_is_internal_error(self, monkeypatch):
+        """Test a KeyError inside a handler is not reported as method not found."""
+        def broken(params):
+            return {}["missing"]
+        
+        monkeypatch.setitem(METHOD_REGISTRY, "broken", broken)
+        responses = dispatch_batch([{"jsonrpc": "2.0", "id": 1, "method": "broken"}])
+        
+        assert responses[0]["error"]["code"] == -32603